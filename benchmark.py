@@ -0,0 +1,1006 @@
+"""
+Замеры производительности шифров
+
+Запуск:
+    python benchmark.py            - выполнить все замеры
+    python benchmark.py magma_g    - выполнить только выбранные замеры
+"""
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+import numpy as np
+
+import cryptography
+from cryptography.atbash import atbash_bytes, atbash_file, atbash_russian
+from cryptography.grille import compile_grille, generate_auto_holes, get_all_states
+from cryptography.hill import (
+    ALPHABET,
+    ALPHABET_SIZE,
+    check_matrix_invertible,
+    matrix_decrypt_array,
+    matrix_encrypt,
+    matrix_encrypt_array,
+    matrix_mod_inverse,
+    text_to_index_array,
+)
+from cryptography.hill_attack import timed_recover_key
+from cryptography.hill_keys import KEY_MODES, generate_invertible_keys
+from cryptography.keystream import KeyStream, random_letters
+from cryptography.magma import (
+    Magma,
+    expand_key,
+    generate_round_keys,
+    get_magma,
+    g_transform_reference,
+    magma_decrypt,
+    magma_decrypt_unrolled,
+    magma_encrypt,
+    magma_encrypt_unrolled,
+)
+from cryptography.magma_modes import ctr_crypt
+from cryptography.magma_numpy import magma_decrypt_many, magma_encrypt_many
+from cryptography.magma_parallel import ctr_crypt_parallel
+from cryptography.otp import encrypt_otp, generate_key
+from cryptography.otp_numpy import encrypt_indices, encrypt_otp_fast, vernam_xor
+from cryptography.otp_numpy import text_to_indices as otp_indices
+from cryptography.otp_pad import OneTimePad, create_pad
+from cryptography.otp_reuse import build_bigram_table as otp_bigram_table
+from cryptography.otp_reuse import crib_drag, find_reused_keys
+from cryptography.playfair import ALPHABET as PLAYFAIR_ALPHABET
+from cryptography.playfair import (
+    PlayfairKey,
+    create_playfair_matrix,
+    get_coordinates,
+    get_playfair_key,
+    playfair_encrypt,
+    playfair_encrypt_file,
+    prepare_text,
+)
+from cryptography.playfair_attack import (
+    anneal,
+    build_quadgram_table,
+    cipher_to_indices,
+    crack_playfair,
+    key_to_matrix,
+    score_indices,
+    text_to_indices,
+)
+from cryptography.transposition import (
+    compile_multi_permutation,
+    compile_permutation,
+    generate_key_order,
+    multi_permutation_encrypt,
+    permute_array,
+    unpermute_array,
+    vertical_permutation_decrypt,
+    vertical_permutation_encrypt,
+)
+from cryptography.transposition_attack import build_bigram_table, recover_key
+
+# Ключ и открытый текст из контрольного примера ГОСТ Р 34.12-2015 (А.2)
+GOST_KEY = "ffeeddccbbaa99887766554433221100f0f1f2f3f4f5f6f7f8f9fafbfcfdfeff"
+GOST_PLAINTEXT = 0xfedcba9876543210
+GOST_CIPHERTEXT = 0x4ee901e5c2d8ca3d
+
+
+def random_blocks(count, seed=0):
+    """Генерирует воспроизводимый набор 64-битных блоков"""
+    rng = random.Random(seed)
+    return [rng.getrandbits(64) for _ in range(count)]
+
+
+def blocks_per_second(encrypt, blocks, round_keys):
+    """Шифрует все блоки и возвращает скорость в блоках в секунду"""
+    start = time.perf_counter()
+    for block in blocks:
+        encrypt(block, round_keys)
+    elapsed = time.perf_counter() - start
+    return len(blocks) / elapsed
+
+
+def magma_encrypt_reference(a, round_keys):
+    """МАГМА с эталонным g (8 замен по тетрадам и отдельный сдвиг)"""
+    a1 = (a >> 32) & 0xFFFFFFFF
+    a0 = a & 0xFFFFFFFF
+    for i in range(31):
+        a1, a0 = a0, g_transform_reference(round_keys[i], a0) ^ a1
+    b1 = g_transform_reference(round_keys[31], a0) ^ a1
+    return (b1 << 32) | a0
+
+
+def bench_magma_g():
+    """Табличное преобразование g против эталонного"""
+    round_keys = generate_round_keys(GOST_KEY)
+
+    assert magma_encrypt_reference(GOST_PLAINTEXT, round_keys) == GOST_CIPHERTEXT
+    assert magma_encrypt(GOST_PLAINTEXT, round_keys) == GOST_CIPHERTEXT
+    assert magma_decrypt(GOST_CIPHERTEXT, round_keys) == GOST_PLAINTEXT
+
+    blocks = random_blocks(20000)
+    before = blocks_per_second(magma_encrypt_reference, blocks, round_keys)
+    after = blocks_per_second(magma_encrypt, blocks, round_keys)
+
+    print(f"  До (8 замен по тетрадам + сдвиг): {before:12,.0f} блоков/с")
+    print(f"  После (4 байтовые таблицы):       {after:12,.0f} блоков/с")
+    print(f"  Ускорение:                        {after / before:12.2f}x")
+
+
+def bench_magma_rounds():
+    """Накладные расходы на вызов: раунды через G[k] против развёрнутых (timeit)"""
+    round_keys = generate_round_keys(GOST_KEY)
+    cipher = get_magma(GOST_KEY)
+    block_bytes = GOST_PLAINTEXT.to_bytes(8, "big")
+    assert magma_encrypt_unrolled(GOST_PLAINTEXT, round_keys) == GOST_CIPHERTEXT
+    assert magma_decrypt_unrolled(GOST_CIPHERTEXT, round_keys) == GOST_PLAINTEXT
+    assert cipher.encrypt_block(block_bytes) == GOST_CIPHERTEXT.to_bytes(8, "big")
+
+    number = 20000
+    cases = [
+        ("эталонный g", lambda: magma_encrypt_reference(GOST_PLAINTEXT, round_keys)),
+        ("magma_encrypt", lambda: magma_encrypt(GOST_PLAINTEXT, round_keys)),
+        ("magma_encrypt_unrolled", lambda: magma_encrypt_unrolled(GOST_PLAINTEXT, round_keys)),
+        ("magma_decrypt_unrolled", lambda: magma_decrypt_unrolled(GOST_CIPHERTEXT, round_keys)),
+        ("Magma.encrypt_block(int)", lambda: cipher.encrypt_block(GOST_PLAINTEXT)),
+        ("Magma.encrypt_block(bytes)", lambda: cipher.encrypt_block(block_bytes)),
+    ]
+    print(f"  Python {sys.version.split()[0]}")
+    baseline = None
+    for title, call in cases:
+        per_call = min(timeit.repeat(call, number=number, repeat=5)) / number * 1e6
+        if title == "magma_encrypt":
+            baseline = per_call
+        speedup = f" ({baseline / per_call:.2f}x)" if baseline else ""
+        print(f"  {title:28s} {per_call:8.2f} мкс/блок{speedup}")
+
+
+def generate_round_keys_loop(key_hex):
+    """Прежнее развёртывание ключа: разбор HEX и список из 32 чисел"""
+    key_bytes = bytes.fromhex(key_hex)
+    subkeys = [int.from_bytes(key_bytes[i * 4:(i + 1) * 4], byteorder='big') for i in range(8)]
+    round_keys = []
+    for _ in range(3):
+        for i in range(8):
+            round_keys.append(subkeys[i])
+    for i in range(7, -1, -1):
+        round_keys.append(subkeys[i])
+    return round_keys
+
+
+def bench_magma_keys():
+    """Развёртывание ключа: HEX и список против Magma и кэша get_magma"""
+    rng = random.Random(0)
+    keys = [rng.randbytes(32) for _ in range(1000)]
+    hex_keys = [key.hex() for key in keys]
+    assert all(list(Magma(key).round_keys) == generate_round_keys_loop(key.hex()) for key in keys[:10])
+    assert get_magma(GOST_KEY).encrypt_block(GOST_PLAINTEXT) == GOST_CIPHERTEXT
+    rounds = 20
+
+    def keys_per_second(setup, values):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for value in values:
+                setup(value)
+        return rounds * len(values) / (time.perf_counter() - start)
+
+    legacy = keys_per_second(generate_round_keys_loop, hex_keys)
+    expanded = keys_per_second(expand_key, keys)
+    compiled = keys_per_second(Magma, keys)
+    get_magma(keys[0])
+    cached = keys_per_second(get_magma, keys)
+
+    print(f"  generate_round_keys (прежний цикл): {legacy:12,.0f} ключей/с")
+    print(f"  expand_key (array('I')):            {expanded:12,.0f} ключей/с ({expanded / legacy:.1f}x)")
+    print(f"  Magma(key):                         {compiled:12,.0f} ключей/с ({compiled / legacy:.1f}x)")
+    print(f"  get_magma (попадание в кэш):        {cached:12,.0f} ключей/с ({cached / legacy:.1f}x)")
+
+
+def bench_magma_ctr_parallel():
+    """Параллельный CTR: пропускная способность от числа процессов"""
+    round_keys = generate_round_keys(GOST_KEY)
+    iv = bytes.fromhex("12345678")
+    data = random.Random(0).randbytes(1 << 20)
+    chunk_size = 64 * 1024
+
+    start = time.perf_counter()
+    expected = ctr_crypt(data, round_keys, iv)
+    single = len(data) / (time.perf_counter() - start) / 1e6
+    print(f"  ctr_crypt (1 ядро, без пула):   {single:8.3f} МБ/с")
+
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        start = time.perf_counter()
+        result = ctr_crypt_parallel(data, round_keys, iv, workers=workers, chunk_size=chunk_size)
+        speed = len(data) / (time.perf_counter() - start) / 1e6
+        assert result == expected
+        print(f"  ctr_crypt_parallel, процессов {workers:3d}: {speed:8.3f} МБ/с ({speed / single:.2f}x)")
+
+
+def bench_magma_numpy():
+    """Пакетная МАГМА на NumPy против поблочного цикла"""
+    round_keys = generate_round_keys(GOST_KEY)
+    gost = np.array([GOST_PLAINTEXT], dtype=np.uint64)
+    assert int(magma_encrypt_many(gost, round_keys)[0]) == GOST_CIPHERTEXT
+
+    blocks = np.random.default_rng(0).integers(0, 2**64, 1_000_000, dtype=np.uint64, endpoint=False)
+    sample = [int(block) for block in blocks[:20000]]
+    scalar = blocks_per_second(magma_encrypt, sample, round_keys)
+
+    start = time.perf_counter()
+    encrypted = magma_encrypt_many(blocks, round_keys)
+    vectorized = len(blocks) / (time.perf_counter() - start)
+
+    assert [int(block) for block in encrypted[:20000]] == [magma_encrypt(b, round_keys) for b in sample]
+    assert np.array_equal(magma_decrypt_many(encrypted, round_keys), blocks)
+
+    print(f"  magma_encrypt (цикл по блокам):        {scalar:12,.0f} блоков/с")
+    print(f"  magma_encrypt_many (1 000 000 блоков): {vectorized:12,.0f} блоков/с")
+    print(f"  Ускорение:                             {vectorized / scalar:12.2f}x")
+
+
+def import_time_us(module, runs=5):
+    """
+    Время холодного импорта модуля в отдельном интерпретаторе (мкс)
+    по данным python -X importtime; возвращает (время, загружен_ли_numpy)
+    """
+    best = None
+    uses_numpy = False
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        for line in completed.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) != 3 or not parts[1].strip().isdigit():
+                continue
+            name = parts[2].strip()
+            if name == "numpy":
+                uses_numpy = True
+            if name == module:
+                cumulative = int(parts[1])
+                best = cumulative if best is None else min(best, cumulative)
+    return best, uses_numpy
+
+
+def bench_import_time():
+    """Время холодного импорта подмодулей пакета cryptography"""
+    for name in ["cryptography"] + [f"cryptography.{sub}" for sub in cryptography.__all__]:
+        elapsed, uses_numpy = import_time_us(name)
+        note = " (с NumPy)" if uses_numpy else ""
+        print(f"  {name:34s} {elapsed / 1000:8.2f} мс{note}")
+
+
+def atbash_russian_loop(text):
+    """Прежняя реализация АТБАШ: поиск индекса и конкатенация по символу"""
+    russian_lower = 'абвгдежзийклмнопрстуфхцчшщъыьэюя'
+    russian_upper = 'АБВГДЕЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ'
+    reversed_lower = russian_lower[::-1]
+    reversed_upper = russian_upper[::-1]
+    result = ''
+    for char in text:
+        if char in russian_lower:
+            result += reversed_lower[russian_lower.index(char)]
+        elif char in russian_upper:
+            result += reversed_upper[russian_upper.index(char)]
+        else:
+            result += char
+    return result
+
+
+def russian_corpus(size_bytes):
+    """Русский текст размером около size_bytes байт в UTF-8"""
+    phrase = "Тише едешь - дальше будешь. Без труда не вытащишь и рыбку из пруда!\n"
+    return phrase * (size_bytes // len(phrase.encode('utf-8')))
+
+# Разнообразная русская проза (отрывки из классики и обычные бытовые описания):
+# по ней строится цепь Маркова для varied_russian_text
+RUSSIAN_PROSE = """
+Мой дядя самых честных правил, когда не в шутку занемог, он уважать себя заставил и лучше
+выдумать не мог. Его пример другим наука; но, боже мой, какая скука с больным сидеть и день и
+ночь, не отходя ни шагу прочь! Какое низкое коварство полуживого забавлять, ему подушки
+поправлять, печально подносить лекарство, вздыхать и думать про себя: когда же черт возьмет
+тебя!
+
+Так думал молодой повеса, летя в пыли на почтовых, всевышней волею Зевеса наследник всех своих
+родных. Друзья Людмилы и Руслана! С героем моего романа без предисловий, сей же час позвольте
+познакомить вас: Онегин, добрый мой приятель, родился на брегах Невы, где, может быть, родились
+вы или блистали, мой читатель; там некогда гулял и я: но вреден север для меня.
+
+Служив отлично благородно, долгами жил его отец, давал три бала ежегодно и промотался наконец.
+Судьба Евгения хранила: сперва мадам за ним ходила, потом мосье ее сменил. Ребенок был резов, но
+мил. Мосье, француз убогий, чтоб не измучилось дитя, учил его всему шутя, не докучал моралью
+строгой, слегка за шалости бранил и в летний сад гулять водил.
+
+Все счастливые семьи похожи друг на друга, каждая несчастливая семья несчастлива по-своему. Все
+смешалось в доме Облонских. Жена узнала, что муж был в связи с бывшею в их доме француженкою
+гувернанткой, и объявила мужу, что не может жить с ним в одном доме. Положение это продолжалось
+уже третий день и мучительно чувствовалось и самими супругами, и всеми членами семьи, и
+домочадцами. Все члены семьи и домочадцы чувствовали, что нет смысла в их сожительстве и что на
+каждом постоялом дворе случайно сошедшиеся люди более связаны между собой, чем они, члены семьи
+и домочадцы Облонских.
+
+В начале июля, в чрезвычайно жаркое время, под вечер, один молодой человек вышел из своей
+каморки, которую нанимал от жильцов в переулке, на улицу и медленно, как бы в нерешимости,
+отправился к мосту. Он благополучно избегнул встречи с своею хозяйкой на лестнице. Каморка его
+приходилась под самою кровлей высокого пятиэтажного дома и походила более на шкаф, чем на
+квартиру.
+
+В ворота гостиницы губернского города въехала довольно красивая рессорная небольшая бричка, в
+какой ездят холостяки: отставные подполковники, штабс-капитаны, помещики, имеющие около сотни
+душ крестьян, словом, все те, которых называют господами средней руки. В бричке сидел господин,
+не красавец, но и не дурной наружности, ни слишком толст, ни слишком тонок; нельзя сказать,
+чтобы стар, однако ж и не так, чтобы слишком молод. Въезд его не произвел в городе совершенно
+никакого шума и не был сопровожден ничем особенным; только два русские мужика, стоявшие у дверей
+кабака против гостиницы, сделали кое-какие замечания, относившиеся, впрочем, более к экипажу,
+чем к сидевшему в нем.
+
+В одной из отдаленных улиц Москвы, в сером доме с белыми колоннами, антресолью и покривившимся
+балконом, жила некогда барыня, вдова, окруженная многочисленною дворней. Сыновья ее служили в
+Петербурге, дочери вышли замуж; она выезжала редко и уединенно доживала последние годы своей
+скупой и скучающей старости. День ее, нерадостный и ненастный, давно прошел; но и вечер ее был
+чернее ночи. Из числа всей ее челяди самым замечательным лицом был дворник Герасим, мужчина
+двенадцати вершков роста, сложенный богатырем и глухонемой от рожденья.
+
+Я ехал на перекладных из Тифлиса. Вся поклажа моей тележки состояла из одного небольшого
+чемодана, который до половины был набит путевыми записками о Грузии. Большая часть из них, к
+счастью для вас, потеряна, а чемодан с остальными вещами, к счастью для меня, остался цел. Уж
+солнце начинало прятаться за снеговой хребет, когда я въехал в Койшаурскую долину. Осетин-
+извозчик неутомимо погонял лошадей, чтоб успеть до ночи взобраться на Койшаурскую гору, и во все
+горло распевал песни.
+
+Было это давно, еще до войны. Отец служил лесничим, и мы жили на краю большого леса, в доме с
+высоким крыльцом и старыми липами у ворот. Зимой дорогу заносило так, что почту привозили раз в
+неделю на санях, а по вечерам мать читала нам вслух, и в печке трещали березовые поленья. Летом
+мы с братом уходили на реку с утра и возвращались только к ужину, загорелые, голодные и
+счастливые. Я до сих пор помню запах сена, скрип колодезного журавля и то, как над лугом
+поднимался туман.
+
+Поезд опаздывал на два часа, и пассажиры, уставшие от ожидания, разбрелись по маленькому
+вокзалу. Кто-то дремал на скамье, подложив под голову узел, кто-то пил чай из жестяной кружки, а
+двое студентов спорили о будущем железных дорог и о том, скоро ли можно будет доехать от столицы
+до океана за неделю. Начальник станции, пожилой человек с седыми усами, то и дело выходил на
+платформу, смотрел вдаль и качал головой.
+
+Наука начинается с удивления. Ребенок спрашивает, почему небо голубое, отчего вода течет вниз и
+куда уходит солнце вечером, и каждый такой вопрос есть маленькое исследование. Взрослые часто
+отвечают торопливо или вовсе отмахиваются, а между тем именно в эти годы складывается привычка
+думать самостоятельно, сомневаться и проверять. Хороший учитель не дает готовых ответов, он
+помогает найти их и радуется, когда ученик замечает то, чего не заметил он сам.
+
+Город просыпался медленно. Сначала на пустых улицах появлялись дворники с метлами, потом
+открывались булочные, и в воздухе пахло свежим хлебом. К восьми часам трамваи уже были полны, у
+газетных киосков выстраивались очереди, а на перекрестках регулировщики в белых перчатках
+направляли поток машин. Рынок шумел с самого рассвета: торговки раскладывали яблоки и огурцы,
+рыбаки выгружали улов, и над всем этим кружили чайки.
+
+Шифр, которым пользовались в переписке, был несложен: каждая буква заменялась другой по заранее
+условленной таблице. Однако противник, перехватив несколько десятков писем, быстро заметил, что
+одни знаки встречаются гораздо чаще других, и по частоте восстановил большую часть букв. С тех
+пор в штабе стали менять ключ каждую неделю, а важные донесения шифровали дважды, сначала
+заменой, а потом перестановкой, так что разобрать их без ключа стало почти невозможно.
+
+Осень в тот год выдалась долгая и теплая. Листья на кленах пожелтели только к середине октября,
+и по утрам в парке было так светло и тихо, что казалось, будто время остановилось. Старик каждый
+день выходил на прогулку с собакой, садился на одну и ту же скамейку у пруда и кормил уток
+хлебом, который приносил в бумажном пакете. Иногда к нему подсаживались соседи, и тогда разговор
+шел о погоде, о ценах на рынке, о детях, которые давно разъехались по разным городам и пишут все
+реже. Когда темнело, он поднимался, звал собаку и медленно шел домой, останавливаясь у каждого
+фонаря, чтобы отдышаться. Дома его ждали остывший чайник, старые книги и письма, которые он
+перечитывал по вечерам, вспоминая молодость, войну и тех, кого уже не было рядом.
+"""
+
+
+def varied_russian_text(length, seed=0, order=3):
+    """
+    Разнообразный русский текст из length символов: цепь Маркова порядка
+    order по символам RUSSIAN_PROSE (буквы и пробелы). Статистика n-грамм
+    до order + 1 символов совпадает с прозой, а сам текст не повторяется.
+    """
+    source = " ".join(re.findall(r"[А-ЯЁ]+", RUSSIAN_PROSE.upper()))
+    followers = {}
+    for i in range(len(source) - order):
+        followers.setdefault(source[i:i + order], []).append(source[i + order])
+
+    rng = random.Random(seed)
+    state = source[:order]
+    result = [state]
+    size = order
+    while size < length:
+        choices = followers.get(state)
+        if choices is None:
+            # Конец прозы: продолжаем со случайного места
+            start = rng.randrange(len(source) - order)
+            state = source[start:start + order]
+            continue
+        char = rng.choice(choices)
+        result.append(char)
+        state = state[1:] + char
+        size += 1
+    return "".join(result)[:length]
+
+
+def bench_atbash():
+    """АТБАШ на таблицах замен против посимвольного цикла"""
+    corpus = russian_corpus(100 * 1024 * 1024)
+    megabytes = len(corpus.encode('utf-8')) / 1e6
+    sample = corpus[:1 << 20]
+    assert atbash_russian(sample) == atbash_russian_loop(sample)
+
+    start = time.perf_counter()
+    atbash_russian_loop(sample)
+    loop_speed = len(sample.encode('utf-8')) / 1e6 / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    atbash_russian(corpus)
+    translate_speed = megabytes / (time.perf_counter() - start)
+
+    encoded = corpus.encode('cp1251')
+    start = time.perf_counter()
+    result = atbash_bytes(encoded)
+    bytes_speed = len(encoded) / 1e6 / (time.perf_counter() - start)
+    assert result[:1000].decode('cp1251') == atbash_russian(corpus[:1000])
+
+    with tempfile.TemporaryDirectory() as directory:
+        src_path = os.path.join(directory, 'corpus.txt')
+        dst_path = os.path.join(directory, 'atbash.txt')
+        with open(src_path, 'w', encoding='utf-8') as src:
+            src.write(corpus)
+        start = time.perf_counter()
+        atbash_file(src_path, dst_path)
+        file_speed = megabytes / (time.perf_counter() - start)
+
+    print(f"  Корпус: {megabytes:.0f} МБ (UTF-8)")
+    print(f"  Цикл по символам (1 МБ):   {loop_speed:10.1f} МБ/с")
+    print(f"  atbash_russian:            {translate_speed:10.1f} МБ/с ({translate_speed / loop_speed:.0f}x)")
+    print(f"  atbash_bytes (cp1251):     {bytes_speed:10.1f} МБ/с ({bytes_speed / loop_speed:.0f}x)")
+    print(f"  atbash_file (частями):     {file_speed:10.1f} МБ/с ({file_speed / loop_speed:.0f}x)")
+
+
+def matrix_encrypt_loop(indices, key_matrix):
+    """Прежняя реализация матричного шифра: np.dot отдельно для каждого блока"""
+    m, n = key_matrix.shape
+    indices = list(indices)
+    while len(indices) % n != 0:
+        indices.append(1)
+    encrypted_indices = []
+    for block_num in range(0, len(indices), n):
+        B = np.array(indices[block_num:block_num+n]).reshape(n, 1)
+        encrypted_indices.extend(np.dot(key_matrix, B).flatten().tolist())
+    return encrypted_indices
+
+
+def bench_hill():
+    """Матричный шифр: одно умножение на весь текст против цикла по блокам"""
+    key_matrix = np.array([[1, 2, 3], [0, 1, 4], [5, 6, 0]])
+    matrix_inv, _ = matrix_mod_inverse(key_matrix, ALPHABET_SIZE)
+    corpus = russian_corpus(1024 * 1024)
+    megabytes = len(corpus.encode('utf-8')) / 1e6
+
+    start = time.perf_counter()
+    indices = text_to_index_array(corpus)
+    to_indices = time.perf_counter() - start
+
+    sample = indices[:30000].tolist()
+    start = time.perf_counter()
+    expected = matrix_encrypt_loop(sample, key_matrix)
+    loop_speed = len(sample) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    encrypted = matrix_encrypt_array(indices, key_matrix)
+    encrypt_time = time.perf_counter() - start
+    assert encrypted[:len(expected)].tolist() == expected
+
+    start = time.perf_counter()
+    decrypted = matrix_decrypt_array(encrypted, matrix_inv)
+    decrypt_time = time.perf_counter() - start
+    assert np.array_equal(decrypted[:len(indices)], indices)
+
+    print(f"  Корпус: {megabytes:.1f} МБ, {len(indices):,} букв")
+    print(f"  text_to_index_array:                {to_indices * 1000:8.1f} мс")
+    print(f"  Цикл по блокам:                     {loop_speed:12,.0f} букв/с")
+    print(f"  matrix_encrypt_array:               {encrypt_time * 1000:8.1f} мс "
+          f"({len(indices) / encrypt_time / loop_speed:.0f}x)")
+    print(f"  matrix_decrypt_array:               {decrypt_time * 1000:8.1f} мс")
+
+
+def bench_hill_attack():
+    """Восстановление ключа матричного шифра по открытому тексту, 2×2 - 10×10"""
+    rng = random.Random(0)
+    for n in range(2, 11):
+        while True:
+            key_matrix = np.array([[rng.randrange(ALPHABET_SIZE) for _ in range(n)] for _ in range(n)])
+            if check_matrix_invertible(key_matrix, ALPHABET_SIZE)[0]:
+                break
+        plaintext = ''.join(rng.choice(ALPHABET) for _ in range(20 * n))
+        cipher_indices = matrix_encrypt(plaintext, key_matrix)
+
+        key, chosen, elapsed = timed_recover_key(plaintext, cipher_indices, n)
+        assert key is not None and np.array_equal(key, key_matrix % ALPHABET_SIZE)
+        print(f"  {n:2d}×{n:<2d}: просмотрено блоков {max(chosen) + 1:3d}, {elapsed * 1000:8.2f} мс")
+
+
+def bench_hill_keys():
+    """Генерация обратимых ключей 8×8 пачками против подбора через float det"""
+    n = 8
+    rng = np.random.default_rng(0)
+    trials = 300
+    start = time.perf_counter()
+    found = 0
+    for _ in range(trials):
+        candidate = rng.integers(0, ALPHABET_SIZE, size=(n, n))
+        det = int(np.round(np.linalg.det(candidate)))
+        found += det % 2 == 1
+    old_speed = found / (time.perf_counter() - start)
+    print(f"  Подбор по одной матрице (float det): {old_speed:12,.0f} ключей/с")
+
+    for mode in KEY_MODES:
+        start = time.perf_counter()
+        keys = generate_invertible_keys(10000, n, mode=mode, seed=0)
+        speed = len(keys) / (time.perf_counter() - start)
+        assert all(check_matrix_invertible(key, ALPHABET_SIZE)[0] for key in keys[:200])
+        density = np.count_nonzero(keys) / keys.size
+        print(f"  generate_invertible_keys({mode:10s}): {speed:12,.0f} ключей/с, "
+              f"ненулевых элементов {density:.0%}")
+
+
+def playfair_encrypt_scan(prepared_text, keyword):
+    """Прежняя реализация Плейфера: новая матрица и поиск букв перебором"""
+    matrix = create_playfair_matrix(keyword)
+    encrypted_text = ""
+    for i in range(0, len(prepared_text), 2):
+        r1, c1 = get_coordinates(matrix, prepared_text[i])
+        r2, c2 = get_coordinates(matrix, prepared_text[i+1])
+        if r1 == r2:
+            encrypted_text += matrix[r1][(c1 + 1) % 6] + matrix[r2][(c2 + 1) % 6]
+        elif c1 == c2:
+            encrypted_text += matrix[(r1 + 1) % 5][c1] + matrix[(r2 + 1) % 5][c2]
+        else:
+            encrypted_text += matrix[r1][c2] + matrix[r2][c1]
+    return encrypted_text
+
+
+def bench_playfair():
+    """Плейфер: скомпилированный ключ и таблица биграмм против перебора матрицы"""
+    keyword = "КРИПТОГРАФИЯ"
+    corpus = russian_corpus(2 * 1024 * 1024)
+    prepared = prepare_text(corpus)
+    bigrams = len(prepared) // 2
+    compiled = PlayfairKey(keyword, bigram_tables=False)
+    tabled = get_playfair_key(keyword)
+    assert tabled.encrypt(prepared) == compiled.encrypt(prepared) == playfair_encrypt_scan(prepared, keyword)
+
+    speeds = []
+    for encrypt in (
+        lambda: playfair_encrypt_scan(prepared, keyword),
+        lambda: compiled.encrypt(prepared),
+        lambda: tabled.encrypt(prepared),
+    ):
+        start = time.perf_counter()
+        encrypt()
+        speeds.append(bigrams / (time.perf_counter() - start))
+
+    messages = ["ПРИВЕТ"] * 10000
+    start = time.perf_counter()
+    for message in messages:
+        playfair_encrypt(message, keyword)
+    short_speed = len(messages) / (time.perf_counter() - start)
+
+    with tempfile.TemporaryDirectory() as directory:
+        src_path = os.path.join(directory, 'corpus.txt')
+        dst_path = os.path.join(directory, 'playfair.txt')
+        with open(src_path, 'w', encoding='utf-8') as src:
+            src.write(corpus)
+        start = time.perf_counter()
+        playfair_encrypt_file(src_path, dst_path, keyword, chunk_size=64 * 1024)
+        file_speed = bigrams / (time.perf_counter() - start)
+        with open(dst_path, encoding='utf-8') as dst:
+            assert dst.read() == tabled.encrypt(prepared)
+
+    print(f"  Биграмм: {bigrams}")
+    print(f"  Перебор матрицы:           {speeds[0]:12.0f} биграмм/с")
+    print(f"  Словарь координат:         {speeds[1]:12.0f} биграмм/с ({speeds[1] / speeds[0]:.1f}x)")
+    print(f"  Таблица 900 биграмм:       {speeds[2]:12.0f} биграмм/с ({speeds[2] / speeds[0]:.1f}x)")
+    print(f"  Файл частями по 64К:       {file_speed:12.0f} биграмм/с (с подготовкой текста)")
+    print(f"  Короткие сообщения (кэш):  {short_speed:12.0f} сообщений/с")
+
+
+def bench_playfair_attack():
+    """Поиск ключа Плейфера отжигом: скорость перебора и время до восстановления ключа"""
+    # Квадграммы и открытый текст - разные участки цепи Маркова по прозе
+    quadgrams = build_quadgram_table(varied_russian_text(1 << 20, seed=1))
+    floor = min(quadgrams)
+    quadgram_dict = {}
+    for index, value in enumerate(quadgrams):
+        if value > floor:
+            quadgram = ""
+            for _ in range(4):
+                index, letter = divmod(index, 30)
+                quadgram = PLAYFAIR_ALPHABET[letter] + quadgram
+            quadgram_dict[quadgram] = value
+
+    plaintext = prepare_text(varied_russian_text(1300, seed=2))[:1000]
+    ciphertext = playfair_encrypt(plaintext, "КРИПТОГРАФИЯ")
+    cipher = cipher_to_indices(ciphertext)
+    rng = random.Random(0)
+    candidates = [rng.sample(range(30), 30) for _ in range(2000)]
+
+    start = time.perf_counter()
+    for candidate in candidates:
+        text = PlayfairKey.from_matrix(key_to_matrix(candidate), bigram_tables=False).decrypt(ciphertext)
+        sum(quadgram_dict.get(text[i:i + 4], floor) for i in range(len(text) - 3))
+    naive_speed = len(candidates) / (time.perf_counter() - start)
+
+    # Одна температура: anneal проверяет ровно iterations кандидатов
+    start = time.perf_counter()
+    anneal(cipher, quadgrams, seed=0, start_temperature=1, step=1, iterations=len(candidates))
+    fast_speed = len(candidates) / (time.perf_counter() - start)
+
+    print(f"  Шифртекст: {len(cipher)} букв")
+    print(f"  Строки и словарь квадграмм: {naive_speed:10.0f} кандидатов/с")
+    print(f"  anneal (индексы и array):   {fast_speed:10.0f} кандидатов/с ({fast_speed / naive_speed:.1f}x)")
+
+    # Отдельный перезапуск находит ключ примерно в 5 случаях из 8, поэтому их несколько
+    restarts, step, iterations = 4, 0.2, 2000
+    options = {"restarts": restarts, "seed": 1, "start_temperature": 20, "step": step, "iterations": iterations}
+    print(f"  Отжиг: {round(20 / step)} температур по {iterations} кандидатов, {restarts} перезапуска")
+    expected = score_indices(text_to_indices(plaintext), quadgrams)
+    results = {}
+    for workers in (1, max(2, os.cpu_count() or 1)):
+        start = time.perf_counter()
+        matrix, found, score = crack_playfair(ciphertext, quadgrams, workers=workers, **options)
+        elapsed = time.perf_counter() - start
+        results[workers] = matrix, found, score
+        correct = sum(a == b for a, b in zip(found, plaintext)) / len(plaintext)
+        status = "восстановлены" if found == plaintext else f"не найдены, верных букв {correct:.0%}"
+        print(f"  {workers:2d} процесс(а): {elapsed:7.2f} с, ключ и открытый текст {status}")
+    print(f"  Оценка найденного ключа {score:.1f}, истинного {expected:.1f}")
+
+    # Пул процессов должен найти тот же ключ, что и последовательные перезапуски
+    serial, parallel = results.values()
+    assert serial == parallel
+    assert found == plaintext
+
+
+def vertical_encrypt_table(text, keyword):
+    """Прежняя реализация вертикальной перестановки: таблица и обход по ячейкам"""
+    key_order = generate_key_order(keyword)
+    num_cols = len(keyword)
+    num_rows = (len(text) + num_cols - 1) // num_cols
+    table = [[text[row * num_cols + col] if row * num_cols + col < len(text) else ''
+              for col in range(num_cols)] for row in range(num_rows)]
+    encrypted = ""
+    for _, col_index in sorted((key_order[i], i) for i in range(num_cols)):
+        for row in range(num_rows):
+            if table[row][col_index]:
+                encrypted += table[row][col_index]
+    return encrypted
+
+
+def bench_vertical():
+    """Вертикальная перестановка: срезы и скомпилированная перестановка против таблицы"""
+    keyword = "ПЕРЕСТАНОВКА"
+    text = cryptography.transposition.clean_text(russian_corpus(8 * 1024 * 1024))
+    sample = text[:1 << 20]
+    encrypted = vertical_permutation_encrypt(text, keyword)
+    assert encrypted[:100] == vertical_encrypt_table(text, keyword)[:100]
+
+    start = time.perf_counter()
+    vertical_encrypt_table(sample, keyword)
+    table_speed = len(sample) / 1e6 / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    vertical_permutation_encrypt(text, keyword)
+    slice_speed = len(text) / 1e6 / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    assert vertical_permutation_decrypt(encrypted, keyword) == text
+    decrypt_speed = len(text) / 1e6 / (time.perf_counter() - start)
+
+    codes = np.frombuffer(text.encode('cp1251'), dtype=np.uint8)
+    compile_permutation(keyword, len(codes))
+    start = time.perf_counter()
+    permuted = permute_array(codes, keyword)
+    numpy_speed = len(codes) / 1e6 / (time.perf_counter() - start)
+    assert permuted.tobytes().decode('cp1251') == encrypted
+    assert np.array_equal(unpermute_array(permuted, keyword), codes)
+
+    # Несколько проходов: перестановки компилируются заранее
+    keywords = ["ПЕРЕСТАНОВКА", "ШИФР", "СТОЛБЕЦ", "КЛЮЧ"]
+    for word in keywords:
+        compile_permutation(word, len(codes))
+    compile_multi_permutation(keywords, len(codes))
+    compile_multi_permutation(keywords, len(sample))
+
+    start = time.perf_counter()
+    chained = sample
+    for word in keywords:
+        chained = vertical_permutation_encrypt(chained, word)
+    chained_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert multi_permutation_encrypt(sample, keywords) == chained
+    composed_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    permuted = codes
+    for word in keywords:
+        permuted = permute_array(permuted, word)
+    numpy_chained_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert np.array_equal(permute_array(codes, keywords), permuted)
+    numpy_composed_time = time.perf_counter() - start
+
+    print(f"  Текст: {len(text) / 1e6:.1f} млн букв")
+    print(f"  Таблица (1 млн букв):      {table_speed:8.1f} млн букв/с")
+    print(f"  Срезы, шифрование:         {slice_speed:8.1f} млн букв/с ({slice_speed / table_speed:.0f}x)")
+    print(f"  Срезы, расшифрование:      {decrypt_speed:8.1f} млн букв/с ({decrypt_speed / table_speed:.0f}x)")
+    print(f"  NumPy по перестановке:     {numpy_speed:8.1f} млн букв/с ({numpy_speed / table_speed:.0f}x)")
+    print(f"  {len(keywords)} прохода срезами (1 млн букв):     {chained_time * 1000:7.1f} мс")
+    print(f"  Составная перестановка (1 млн букв):  {composed_time * 1000:7.1f} мс")
+    print(f"  {len(keywords)} прохода NumPy (весь текст):       {numpy_chained_time * 1000:7.1f} мс")
+    print(f"  Составная перестановка NumPy:         {numpy_composed_time * 1000:7.1f} мс")
+
+
+def bench_transposition_attack():
+    """Восстановление ключа вертикальной перестановки лучевым поиском, 5 - 20 столбцов"""
+    # Биграммы и открытый текст - разные участки цепи Маркова по прозе
+    scores = build_bigram_table(varied_russian_text(64 * 1024, seed=1))
+    plaintext = cryptography.transposition.clean_text(varied_russian_text(800, seed=2))[:600]
+    rng = random.Random(0)
+    alphabet = cryptography.transposition.ALPHABET
+    for num_cols in (5, 10, 15, 20):
+        keyword = ''.join(rng.sample(alphabet, num_cols))
+        ciphertext = vertical_permutation_encrypt(plaintext, keyword)
+        start = time.perf_counter()
+        key_order, found, _ = recover_key(ciphertext, scores, widths=range(2, 21))
+        elapsed = time.perf_counter() - start
+        print(f"  {num_cols:2d} столбцов: {elapsed:6.2f} с (ширины 2 - 20)")
+        assert key_order == generate_key_order(keyword)
+
+    # Тот же поиск по ширинам в пуле процессов должен дать тот же ключ
+    workers = max(2, os.cpu_count() or 1)
+    start = time.perf_counter()
+    parallel_order, _, _ = recover_key(ciphertext, scores, widths=range(2, 21), workers=workers)
+    elapsed = time.perf_counter() - start
+    print(f"  {num_cols:2d} столбцов: {elapsed:6.2f} с в {workers} процессах")
+    assert parallel_order == key_order
+
+
+def cardano_encrypt_grid(block, rows, cols, holes):
+    """Прежняя реализация решетки Кардано: состояния и таблица на каждый блок"""
+    grid = [['' for _ in range(cols)] for _ in range(rows)]
+    text_idx = 0
+    for current_holes in get_all_states(holes, rows, cols):
+        for r, c in current_holes:
+            grid[r][c] = block[text_idx]
+            text_idx += 1
+    return ''.join([''.join(row) for row in grid])
+
+
+def bench_cardano():
+    """Решетка Кардано: скомпилированная перестановка против таблицы на каждый блок"""
+    rows, cols = 10, 10
+    random.seed(0)
+    holes, _ = generate_auto_holes(rows, cols)
+    grille = compile_grille(rows, cols, holes)
+    text = cryptography.grille.normalize_text(russian_corpus(4 * 1024 * 1024))
+    text = text[:len(text) - len(text) % grille.block_size]
+    sample = text[:100 * grille.block_size]
+
+    start = time.perf_counter()
+    expected = ''.join(cardano_encrypt_grid(sample[i:i + grille.block_size], rows, cols, holes)
+                       for i in range(0, len(sample), grille.block_size))
+    grid_speed = len(sample) / 1e6 / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    encrypted = grille.encrypt(text)
+    compiled_speed = len(text) / 1e6 / (time.perf_counter() - start)
+    assert encrypted[:len(sample)] == expected
+
+    codes = np.frombuffer(text.encode('cp1251'), dtype=np.uint8)
+    start = time.perf_counter()
+    encrypted_codes = grille.encrypt_array(codes)
+    numpy_speed = len(codes) / 1e6 / (time.perf_counter() - start)
+    assert encrypted_codes.tobytes().decode('cp1251') == encrypted
+    assert np.array_equal(grille.decrypt_array(encrypted_codes), codes)
+
+    print(f"  Решетка {rows}x{cols}, текст {len(text) / 1e6:.1f} млн букв")
+    print(f"  Таблица на каждый блок:    {grid_speed:8.2f} млн букв/с")
+    print(f"  Скомпилированная решетка:  {compiled_speed:8.2f} млн букв/с ({compiled_speed / grid_speed:.0f}x)")
+    print(f"  NumPy, все блоки сразу:    {numpy_speed:8.2f} млн букв/с ({numpy_speed / grid_speed:.0f}x)")
+
+
+def bench_keystream():
+    """Случайные буквы: байты и bytes.translate против random.choice по букве"""
+    alphabet = cryptography.keystream.ALPHABET
+    count = 10 * 1000 * 1000
+
+    start = time.perf_counter()
+    "".join(random.choice(alphabet) for _ in range(count // 10))
+    choice_speed = count / 10 / 1e6 / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    random_letters(count)
+    secure_speed = count / 1e6 / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    letters = KeyStream(seed=0).letters(count)
+    seeded_speed = count / 1e6 / (time.perf_counter() - start)
+    assert letters == KeyStream(seed=0).letters(count)
+
+    print(f"  random.choice (1 млн букв):  {choice_speed:8.1f} млн букв/с")
+    print(f"  os.urandom + translate:      {secure_speed:8.1f} млн букв/с ({secure_speed / choice_speed:.0f}x)")
+    print(f"  KeyStream(seed) + translate: {seeded_speed:8.1f} млн букв/с ({seeded_speed / choice_speed:.0f}x)")
+
+
+def encrypt_otp_loop(text, key):
+    """Прежнее гаммирование: два поиска индекса и конкатенация по символу"""
+    alphabet = cryptography.otp.ALPHABET
+    result = ""
+    for i in range(len(text)):
+        result += alphabet[(alphabet.find(text[i]) + alphabet.find(key[i])) % len(alphabet)]
+    return result
+
+
+def bench_otp():
+    """Гаммирование: цикл по символу, генератор, NumPy по строке и по индексам, XOR байт"""
+    count = 50 * 1000 * 1000
+    text = generate_key(count)
+    key = generate_key(count)
+    sample, sample_key = text[:1000 * 1000], key[:1000 * 1000]
+    assert encrypt_otp_loop(sample, sample_key) == encrypt_otp(sample, sample_key) \
+        == encrypt_otp_fast(sample, sample_key)
+
+    start = time.perf_counter()
+    encrypt_otp_loop(sample, sample_key)
+    loop_speed = len(sample) / 1e6 / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    encrypt_otp(sample, sample_key)
+    join_speed = len(sample) / 1e6 / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    encrypt_otp_fast(text, key)
+    fast_speed = count / 1e6 / (time.perf_counter() - start)
+
+    plain, key_indices = otp_indices(text), otp_indices(key)
+    start = time.perf_counter()
+    encrypt_indices(plain, key_indices, out=plain)
+    indices_speed = count / 1e6 / (time.perf_counter() - start)
+
+    data = os.urandom(4 * count)
+    pad = os.urandom(len(data))
+    out = bytearray(len(data))
+    start = time.perf_counter()
+    vernam_xor(memoryview(data), memoryview(pad), out)
+    xor_speed = len(data) / 1e6 / (time.perf_counter() - start)
+
+    print(f"  цикл с find и += (1 млн):  {loop_speed:9.1f} млн букв/с")
+    print(f"  encrypt_otp (1 млн):       {join_speed:9.1f} млн букв/с ({join_speed / loop_speed:.1f}x)")
+    print(f"  encrypt_otp_fast (строки): {fast_speed:9.1f} млн букв/с ({fast_speed / loop_speed:.0f}x)")
+    print(f"  encrypt_indices (uint8):   {indices_speed:9.1f} млн букв/с ({indices_speed / loop_speed:.0f}x)")
+    print(f"  vernam_xor (memoryview):   {xor_speed:9.1f} МБ/с")
+
+
+def bench_otp_pad():
+    """Файл-блокнот: выдача кусков с журналом и шифрование кусками из mmap"""
+    message_length = 1000 * 1000
+    messages = 100
+    text = generate_key(message_length)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "pad.bin")
+        start = time.perf_counter()
+        create_pad(path, message_length * messages + 10000)
+        create_speed = (message_length * messages) / 1e6 / (time.perf_counter() - start)
+
+        with OneTimePad(path) as pad:
+            start = time.perf_counter()
+            for _ in range(1000):
+                pad.reserve(10)
+            reserve_rate = 1000 / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for _ in range(messages):
+                offset, cipher = pad.encrypt(text)
+            encrypt_speed = message_length * messages / 1e6 / (time.perf_counter() - start)
+            assert pad.decrypt(cipher, offset) == text
+
+    print(f"  создание блокнота:            {create_speed:9.1f} МБ/с")
+    print(f"  выдача куска (fsync журнала): {reserve_rate:9.0f} кусков/с")
+    print(f"  encrypt по 1 млн букв:        {encrypt_speed:9.1f} млн букв/с")
+
+
+def bench_otp_reuse():
+    """Поиск общего ключа: индекс n-грамм против проверки всех пар"""
+    count = 2000
+    length = 1000
+    stream = KeyStream(seed=0)
+    words = russian_corpus(1024).split()
+    ciphers = [stream.letters(length) for _ in range(count)]
+
+    # Несколько пар сообщений (случайные последовательности слов), зашифрованных одним ключом;
+    # номера сообщений не повторяются, иначе вторая пара перезаписала бы первую
+    rng = random.Random(0)
+    pairs = 10
+    indices = rng.sample(range(count), 2 * pairs)
+    planted = set()
+    for first, second in zip(indices[::2], indices[1::2]):
+        first, second = sorted((first, second))
+        key = stream.letters(length)
+        for index in (first, second):
+            text = ""
+            while len(text) < length:
+                text += cryptography.otp.normalize_text(rng.choice(words))
+            ciphers[index] = encrypt_otp(text[:length], key)
+        planted.add((first, second))
+
+    # Шпаргалка из одной буквы с таблицей: без оценки, результаты по позициям
+    first, second = min(planted)
+    table = otp_bigram_table(" ".join(words))
+    single = crib_drag(ciphers[first], ciphers[second], "В", table)
+    assert all(result[0] is None for result in single)
+    assert [result[1] for result in single] == sorted(result[1] for result in single)
+    assert crib_drag(ciphers[first], ciphers[second], "ВЫ", table, limit=1)[0][0] is not None
+
+    for title, options in [
+        ("все пары", {"exhaustive": True}),
+        ("триграммы, >= 1 общей", {"gram": 3}),
+        ("биграммы, >= 3 общих", {"gram": 2, "min_shared": 3}),
+    ]:
+        start = time.perf_counter()
+        found = {(first, second) for first, second, _, _ in find_reused_keys(ciphers, **options)}
+        elapsed = time.perf_counter() - start
+        print(f"  {title:22s} {elapsed:7.2f} с, найдено {len(found & planted)} из {len(planted)}, "
+              f"ложных {len(found - planted)}")
+        assert found & planted == planted
+
+
+BENCHMARKS = {
+    "magma_g": bench_magma_g,
+    "magma_rounds": bench_magma_rounds,
+    "magma_keys": bench_magma_keys,
+    "magma_ctr_parallel": bench_magma_ctr_parallel,
+    "magma_numpy": bench_magma_numpy,
+    "import_time": bench_import_time,
+    "atbash": bench_atbash,
+    "hill": bench_hill,
+    "hill_attack": bench_hill_attack,
+    "hill_keys": bench_hill_keys,
+    "playfair": bench_playfair,
+    "playfair_attack": bench_playfair_attack,
+    "vertical": bench_vertical,
+    "transposition_attack": bench_transposition_attack,
+    "cardano": bench_cardano,
+    "keystream": bench_keystream,
+    "otp": bench_otp,
+    "otp_pad": bench_otp_pad,
+    "otp_reuse": bench_otp_reuse,
+}
+
+
+def main(argv):
+    names = argv or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        print(f"Неизвестные замеры: {', '.join(unknown)}")
+        print(f"Доступные: {', '.join(BENCHMARKS)}")
+        return 1
+
+    for name in names:
+        print("=" * 80)
+        print(f"{name}: {BENCHMARKS[name].__doc__}")
+        print("=" * 80)
+        BENCHMARKS[name]()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
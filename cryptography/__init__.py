@@ -0,0 +1,57 @@
+"""
+Учебные реализации шифров для русского алфавита и МАГМА
+
+Подмодули:
+    magma                - блочный шифр МАГМА (ГОСТ Р 34.12-2015)
+    magma_modes          - режимы работы МАГМА (ГОСТ Р 34.13-2015)
+    magma_parallel       - режим CTR на нескольких процессах
+    magma_numpy          - пакетная МАГМА над массивами NumPy
+    otp                  - шифр гаммирования (Вернама/Шеннона)
+    otp_numpy            - шифр гаммирования и побайтовый XOR над массивами NumPy
+    otp_pad              - файл-блокнот с журналом выданных ключей
+    otp_reuse            - поиск повторно использованного ключа гаммирования
+    keystream            - криптостойкий и воспроизводимый источник случайных букв
+    hill                 - матричный шифр (шифр Хилла)
+    hill_attack          - восстановление ключа матричного шифра по открытому тексту
+    hill_keys            - генерация обратимых ключей матричного шифра
+    playfair             - шифр Плейфера 5x6
+    playfair_attack      - поиск ключа Плейфера по шифртексту (имитация отжига)
+    transposition        - шифр вертикальной перестановки
+    transposition_attack - восстановление ключа вертикальной перестановки
+    grille               - решетка Кардано
+    atbash               - шифр АТБАШ
+
+Подмодули загружаются при первом обращении (cryptography.hill и т.д.),
+поэтому NumPy импортируется только для матричного шифра, magma_numpy,
+otp_numpy, otp_pad и otp_reuse.
+"""
+import importlib
+
+__all__ = [
+    "magma",
+    "magma_modes",
+    "magma_parallel",
+    "magma_numpy",
+    "otp",
+    "otp_numpy",
+    "otp_pad",
+    "otp_reuse",
+    "keystream",
+    "hill",
+    "hill_attack",
+    "hill_keys",
+    "playfair",
+    "playfair_attack",
+    "transposition",
+    "transposition_attack",
+    "grille",
+    "atbash",
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,73 @@
+"""
+Шифр АТБАШ для русского алфавита
+"""
+from functools import lru_cache
+
+RUSSIAN_LOWER = 'абвгдежзийклмнопрстуфхцчшщъыьэюя'
+RUSSIAN_UPPER = 'АБВГДЕЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ'
+
+# Таблица замен строится один раз при импорте: каждая буква заменяется
+# на букву из обратного алфавита. Таблица - список по кодам символов
+# (до 'я' включительно): для символов с большими кодами str.translate
+# получает IndexError и оставляет их без изменений
+_ATBASH_MAPPING = str.maketrans(
+    RUSSIAN_LOWER + RUSSIAN_UPPER,
+    RUSSIAN_LOWER[::-1] + RUSSIAN_UPPER[::-1],
+)
+ATBASH_TABLE = [_ATBASH_MAPPING.get(code, code) for code in range(max(_ATBASH_MAPPING) + 1)]
+
+# Размер части при потоковой обработке файла (в символах)
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def atbash_russian(text):
+    """
+    Шифрует текст шифром АТБАШ для русского алфавита
+    Пробелы, знаки препинания и прочие символы остаются без изменений.
+    Текст, представимый в cp1251, обрабатывается через bytes.translate
+    (в несколько раз быстрее), остальной - через str.translate
+    """
+    try:
+        encoded = text.encode('cp1251')
+    except UnicodeEncodeError:
+        return text.translate(ATBASH_TABLE)
+    return encoded.translate(_bytes_table('cp1251')).decode('cp1251')
+
+
+@lru_cache(maxsize=None)
+def _bytes_table(encoding):
+    """Таблица замен для bytes.translate в однобайтовой кодировке"""
+    source = (RUSSIAN_LOWER + RUSSIAN_UPPER).encode(encoding)
+    target = (RUSSIAN_LOWER[::-1] + RUSSIAN_UPPER[::-1]).encode(encoding)
+    if len(source) != len(RUSSIAN_LOWER + RUSSIAN_UPPER):
+        raise ValueError(f"Кодировка {encoding} не однобайтовая, используйте atbash_russian")
+    return bytes.maketrans(source, target)
+
+
+def atbash_bytes(data, encoding='cp1251'):
+    """
+    Шифрует АТБАШ текст в однобайтовой кодировке (cp1251, koi8_r и т.п.)
+    без декодирования в str - одним вызовом bytes.translate
+    """
+    return bytes(data).translate(_bytes_table(encoding))
+
+
+def atbash_stream(chunks):
+    """
+    Шифрует АТБАШ последовательность частей текста (строки файла,
+    куски фиксированного размера) и выдаёт результат по частям
+    АТБАШ заменяет символы независимо, поэтому границы частей не важны
+    """
+    for chunk in chunks:
+        yield atbash_russian(chunk)
+
+
+def atbash_file(src_path, dst_path, encoding='utf-8', chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Шифрует АТБАШ текстовый файл частями по chunk_size символов,
+    поэтому расход памяти не зависит от размера файла
+    """
+    with open(src_path, encoding=encoding, newline='') as src, \
+            open(dst_path, 'w', encoding=encoding, newline='') as dst:
+        for chunk in atbash_stream(iter(lambda: src.read(chunk_size), '')):
+            dst.write(chunk)
@@ -0,0 +1,152 @@
+"""
+Решетка Кардано с симметричными поворотами
+
+Ключ-решетка задаёт перестановку клеток таблицы rows x cols: порядок,
+в котором клетки заполняются через отверстия в 4 положениях. Она
+вычисляется один раз (compile_grille), после чего длинный текст
+шифруется блоками по rows * cols букв - одной выборкой на блок,
+а массивы NumPy - одной выборкой сразу по всем блокам.
+"""
+import random
+from array import array
+from functools import lru_cache
+
+from .keystream import random_letters
+
+ALPHABET = "АБВГДЕЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ"
+
+def normalize_text(text):
+    text = text.upper().replace('Ё', 'Е')
+    return ''.join(c for c in text if c in ALPHABET)
+
+def get_symmetric_coords(r, c, rows, cols):
+    """Возвращает 4 симметричные координаты для ячейки (r, c)."""
+    return [
+        (r, c),                          # 1-е положение
+        (r, cols - 1 - c),               # 2-е положение (отражение по гориз.)
+        (rows - 1 - r, c),               # 3-е положение (отражение по вертик.)
+        (rows - 1 - r, cols - 1 - c)     # 4-е положение (180 градусов)
+    ]
+
+def generate_auto_holes(rows, cols):
+    """Автогенерация отверстий."""
+    if rows % 2 != 0 or cols % 2 != 0:
+        raise ValueError("Размеры должны быть четными!")
+    
+    holes = []
+    holes_grid = [['.' for _ in range(cols)] for _ in range(rows)]
+    
+    for r in range(rows // 2):
+        for c in range(cols // 2):
+            coords = get_symmetric_coords(r, c, rows, cols)
+            chosen = random.choice(coords)
+            holes.append(chosen)
+            holes_grid[chosen[0]][chosen[1]] = 'O'
+            
+    return holes, holes_grid
+
+def get_all_states(holes, rows, cols):
+    """Вычисляет 4 набора координат (состояния решетки)."""
+    states = []
+    for i in range(4):
+        state_holes = []
+        for r, c in holes:
+            sym_points = get_symmetric_coords(r, c, rows, cols)
+            state_holes.append(sym_points[i])
+        state_holes.sort() # Важно для порядка чтения/записи
+        states.append(state_holes)
+    return states
+
+class CompiledGrille:
+    """
+    Скомпилированная решетка: order[i] - номер клетки (r * cols + c),
+    в которую записывается i-я буква блока, inverse - обратная перестановка
+    """
+
+    def __init__(self, rows, cols, holes):
+        self.rows = rows
+        self.cols = cols
+        self.block_size = rows * cols
+        self.order = array('I', [
+            r * cols + c
+            for state in get_all_states(holes, rows, cols)
+            for r, c in state
+        ])
+        if sorted(self.order) != list(range(self.block_size)):
+            raise ValueError("Отверстия решетки должны открывать каждую клетку ровно один раз")
+        self.inverse = array('I', bytes(self.order.itemsize * self.block_size))
+        for position, cell in enumerate(self.order):
+            self.inverse[cell] = position
+
+    def pad(self, text, stream=None):
+        """
+        Дополняет текст случайными буквами до целого числа блоков (минимум один)
+        stream - источник букв KeyStream (по умолчанию криптостойкий)
+        """
+        blocks = max(1, -(-len(text) // self.block_size))
+        return text + random_letters(blocks * self.block_size - len(text), stream)
+
+    def encrypt(self, text):
+        """Шифрует нормализованный текст длины, кратной block_size"""
+        self._check_length(len(text))
+        size = self.block_size
+        inverse = self.inverse
+        return ''.join([
+            ''.join([block[i] for i in inverse])
+            for block in (text[start:start + size] for start in range(0, len(text), size))
+        ])
+
+    def decrypt(self, cipher_text):
+        """Расшифровывает текст длины, кратной block_size (дополнение остаётся)"""
+        self._check_length(len(cipher_text))
+        size = self.block_size
+        order = self.order
+        return ''.join([
+            ''.join([block[i] for i in order])
+            for block in (cipher_text[start:start + size] for start in range(0, len(cipher_text), size))
+        ])
+
+    def encrypt_array(self, values):
+        """
+        Шифрует массив NumPy (коды букв и т.п.) длины, кратной block_size:
+        все блоки переставляются одной выборкой
+        """
+        self._check_length(len(values))
+        return values.reshape(-1, self.block_size)[:, self.inverse].reshape(-1)
+
+    def decrypt_array(self, values):
+        """Расшифровывает массив NumPy, зашифрованный encrypt_array"""
+        self._check_length(len(values))
+        return values.reshape(-1, self.block_size)[:, self.order].reshape(-1)
+
+    def _check_length(self, length):
+        if length % self.block_size != 0:
+            raise ValueError(f"Длина текста должна быть кратна размеру решетки ({self.block_size})")
+
+
+@lru_cache(maxsize=64)
+def _compiled_grille(rows, cols, holes):
+    return CompiledGrille(rows, cols, holes)
+
+
+def compile_grille(rows, cols, holes):
+    """Возвращает скомпилированную решетку из кэша (по размерам и отверстиям)"""
+    return _compiled_grille(rows, cols, tuple(map(tuple, holes)))
+
+
+def encrypt_cardano(text, rows, cols, holes, stream=None):
+    """
+    Шифрование.
+    Текст длиннее одной решетки шифруется несколькими блоками,
+    пустые клетки последнего блока заполняются случайными буквами
+    из stream (KeyStream; по умолчанию - криптостойкий поток).
+    Возвращает (шифртекст, таблица построчно по всем блокам).
+    """
+    grille = compile_grille(rows, cols, holes)
+    cipher_text = grille.encrypt(grille.pad(normalize_text(text), stream))
+    grid = [list(cipher_text[i:i+cols]) for i in range(0, len(cipher_text), cols)]
+    return cipher_text, grid
+
+def decrypt_cardano(cipher_text, rows, cols, holes):
+    """Расшифрование (по блокам размером в одну решетку)."""
+    return compile_grille(rows, cols, holes).decrypt(cipher_text)
@@ -0,0 +1,424 @@
+"""
+Матричный шифр (шифр Хилла) для русского алфавита
+"""
+from functools import lru_cache
+
+import numpy as np
+
+# Русский алфавит без Ё (32 буквы)
+ALPHABET = 'АБВГДЕЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ'
+ALPHABET_SIZE = len(ALPHABET)
+
+
+# Таблица "код символа -> индекс буквы (с 1)", 0 - символ не из алфавита
+_CODE_TO_INDEX = np.zeros(max(map(ord, ALPHABET)) + 1, dtype=np.int64)
+_CODE_TO_INDEX[[ord(char) for char in ALPHABET]] = np.arange(1, ALPHABET_SIZE + 1)
+
+# Буквы алфавита в однобайтовой кодировке для обратного преобразования
+_ALPHABET_BYTES = np.frombuffer(ALPHABET.encode('cp1251'), dtype=np.uint8)
+
+
+def text_to_index_array(text):
+    """Преобразует текст в массив индексов np.int64 (начиная с 1)"""
+    text = text.upper().replace('Ё', 'Е')
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    # Символы с кодами за пределами таблицы заменяем кодом 0 (не буква)
+    codes = np.where(codes < len(_CODE_TO_INDEX), codes, 0)
+    indices = _CODE_TO_INDEX[codes]
+    return indices[indices != 0]
+
+
+def index_array_to_text(indices):
+    """Преобразует массив индексов обратно в текст"""
+    # Приводим к диапазону 1-32
+    positions = ((np.asarray(indices) - 1) % ALPHABET_SIZE).astype(np.intp)
+    return _ALPHABET_BYTES[positions].tobytes().decode('cp1251')
+
+
+def text_to_indices(text):
+    """Преобразует текст в последовательность индексов (начиная с 1)"""
+    return text_to_index_array(text).tolist()
+
+
+def indices_to_text(indices):
+    """Преобразует индексы обратно в текст"""
+    return index_array_to_text(np.asarray(indices))
+
+
+def pad_index_array(indices, n):
+    """Дополняет массив индексов единицами (буква 'А') до длины, кратной n"""
+    indices = np.asarray(indices)
+    padding = -len(indices) % n
+    if padding:
+        indices = np.concatenate([indices, np.ones(padding, dtype=indices.dtype)])
+    return indices
+
+
+def parse_key_matrix(key_string, rows, cols):
+    """
+    Парсит строку с числами в матрицу
+    
+    key_string - строка с числами (например: "1 2 3 4 5 6")
+    rows - количество строк
+    cols - количество столбцов
+    """
+    # Разбиваем строку на числа
+    numbers = key_string.replace(',', ' ').split()
+    
+    # Преобразуем в целые числа
+    try:
+        numbers = [int(num) for num in numbers if num]
+    except ValueError:
+        return None
+    
+    # Проверяем количество
+    if len(numbers) != rows * cols:
+        return None
+    
+    # Создаем матрицу
+    matrix = np.array(numbers).reshape(rows, cols)
+    
+    return matrix
+
+
+def gcd(a, b):
+    """Наибольший общий делитель"""
+    while b:
+        a, b = b, a % b
+    return abs(a)
+
+
+def extended_gcd(a, b):
+    """
+    Расширенный алгоритм Евклида
+    Возвращает (g, x, y), где g = НОД(a, b) и a·x + b·y = g
+    """
+    x0, x1, y0, y1 = 1, 0, 0, 1
+    while b:
+        q = a // b
+        a, b = b, a - q * b
+        x0, x1 = x1, x0 - q * x1
+        y0, y1 = y1, y0 - q * y1
+    return a, x0, y0
+
+
+def mod_inverse(a, m):
+    """Находит обратный элемент по модулю m (расширенный алгоритм Евклида)"""
+    g, x, _ = extended_gcd(a % m, m)
+    if g != 1:
+        return None
+    return x % m
+
+
+def key_fingerprint(matrix):
+    """Неизменяемый отпечаток матрицы-ключа для кэширования: кортеж строк"""
+    return tuple(tuple(int(value) for value in row) for row in matrix)
+
+
+def determinant(matrix):
+    """
+    Точный определитель целочисленной матрицы (алгоритм Барейса)
+    Все деления выполняются нацело, поэтому нет ошибок округления
+    при любом размере матрицы и любых значениях элементов
+    """
+    a = [list(row) for row in key_fingerprint(matrix)]
+    n = len(a)
+    sign = 1
+    previous = 1
+    
+    for k in range(n - 1):
+        # Ищем ненулевой ведущий элемент
+        if a[k][k] == 0:
+            for i in range(k + 1, n):
+                if a[i][k] != 0:
+                    a[k], a[i] = a[i], a[k]
+                    sign = -sign
+                    break
+            else:
+                return 0
+        
+        for i in range(k + 1, n):
+            for j in range(k + 1, n):
+                a[i][j] = (a[i][j] * a[k][k] - a[i][k] * a[k][j]) // previous
+        previous = a[k][k]
+    
+    return sign * a[n - 1][n - 1] if n else 1
+
+
+@lru_cache(maxsize=256)
+def _mod_inverse_rows(fingerprint, mod):
+    """
+    Обратная матрица по модулю mod методом Гаусса-Жордана над Z/mod
+    Возвращает кортеж строк или None, если матрица необратима.
+    
+    Для составного модуля (например, 32) ведущий элемент должен быть
+    обратимым. Если такого в столбце нет, строки комбинируются
+    по алгоритму Евклида, пока в ведущей позиции не окажется НОД
+    элементов столбца; если и он необратим, необратима и матрица.
+    """
+    n = len(fingerprint)
+    a = [[value % mod for value in row] + [int(i == j) for j in range(n)]
+         for i, row in enumerate(fingerprint)]
+    
+    for col in range(n):
+        # Ищем строку с обратимым ведущим элементом
+        for r in range(col, n):
+            if gcd(a[r][col], mod) == 1:
+                a[col], a[r] = a[r], a[col]
+                break
+        else:
+            # Алгоритм Евклида по строкам: обнуляем столбец ниже ведущей
+            for r in range(col + 1, n):
+                while a[r][col]:
+                    q = a[col][col] // a[r][col]
+                    a[col] = [(x - q * y) % mod for x, y in zip(a[col], a[r])]
+                    a[col], a[r] = a[r], a[col]
+        
+        pivot_inv = mod_inverse(a[col][col], mod)
+        if pivot_inv is None:
+            return None
+        
+        a[col] = [x * pivot_inv % mod for x in a[col]]
+        for r in range(n):
+            factor = a[r][col]
+            if r != col and factor:
+                a[r] = [(x - factor * y) % mod for x, y in zip(a[r], a[col])]
+    
+    return tuple(tuple(row[n:]) for row in a)
+
+
+def matrix_mod_inverse(matrix, mod):
+    """
+    Находит обратную матрицу по модулю
+    Возвращает (обратная_матрица, успех)
+    
+    Вычисления ведутся точно в целых числах (без np.linalg),
+    результат кэшируется по отпечатку матрицы-ключа и модулю
+    """
+    # Матрица должна быть квадратной
+    if matrix.shape[0] != matrix.shape[1]:
+        return None, False
+    
+    rows = _mod_inverse_rows(key_fingerprint(matrix), mod)
+    if rows is None:
+        return None, False
+    
+    return np.array(rows, dtype=np.int64).reshape(matrix.shape), True
+
+
+def check_matrix_invertible(matrix, mod):
+    """
+    Проверяет, существует ли обратная матрица
+    Возвращает (существует, определитель, НОД)
+    """
+    if matrix.shape[0] != matrix.shape[1]:
+        return False, None, None
+    
+    det_mod = determinant(matrix) % mod
+    gcd_value = gcd(det_mod, mod)
+    
+    return gcd_value == 1, det_mod, gcd_value
+
+
+def print_encrypt_trace(key_matrix, indices, encrypted_indices):
+    """
+    Выводит подробный ход шифрования по блокам
+    indices - дополненные индексы открытого текста
+    """
+    m, n = key_matrix.shape
+    
+    print(f"\nПроцесс шифрования:")
+    print("=" * 80)
+    print(f"Размер матрицы-ключа A: {m}×{n}")
+    print(f"Размер вектора открытого текста B: {n}×1 (вертикальный)")
+    print(f"Размер вектора зашифрованного текста C: {m}×1 (вертикальный)")
+    print(f"Формула: C = A · B")
+    print("=" * 80)
+    
+    for block_num in range(0, len(indices), n):
+        B = indices[block_num:block_num+n]
+        C = encrypted_indices[block_num // n * m:block_num // n * m + m]
+        
+        print(f"\n{'─'*80}")
+        print(f"Блок {block_num//n + 1}:")
+        print(f"\nВектор B ({n}×1) - открытый текст:")
+        for i, val in enumerate(B):
+            print(f"  b_{i+1} = {val:3d}  (буква '{ALPHABET[val-1]}')")
+        
+        print(f"\nМатрица-ключ A ({m}×{n}):")
+        for i in range(m):
+            row_str = "  "
+            for j in range(n):
+                row_str += f"{key_matrix[i][j]:4d} "
+            print(row_str)
+        
+        print(f"\nВычисление компонентов вектора C ({m}×1):")
+        for i in range(m):
+            terms = [f"{key_matrix[i][j]}·{B[j]}" for j in range(n)]
+            print(f"  c_{i+1} = {' + '.join(terms)}")
+            print(f"      = {' + '.join([str(key_matrix[i][j] * B[j]) for j in range(n)])}")
+            print(f"      = {C[i]}")
+        
+        print(f"\nРезультат C ({m}×1):")
+        for i, val in enumerate(C):
+            print(f"  c_{i+1} = {val:3d}")
+    
+    print("=" * 80)
+
+
+def print_decrypt_trace(matrix_inv, encrypted_indices, decrypted_indices):
+    """
+    Выводит обратную матрицу и подробный ход расшифрования по блокам
+    encrypted_indices - дополненные индексы шифртекста
+    """
+    n = matrix_inv.shape[0]
+    
+    print(f"\nОбратная матрица A^(-1) ({n}×{n}) по модулю {ALPHABET_SIZE}:")
+    for row in matrix_inv:
+        row_str = "  "
+        for val in row:
+            row_str += f"{val:4d} "
+        print(row_str)
+    
+    print(f"\nПроцесс расшифрования:")
+    print("=" * 80)
+    
+    for block_num in range(0, len(encrypted_indices), n):
+        C = encrypted_indices[block_num:block_num+n]
+        B = decrypted_indices[block_num:block_num+n]
+        
+        print(f"\nБлок {block_num//n + 1}:")
+        print(f"  Зашифрованный вектор C ({n}×1):")
+        for i, val in enumerate(C):
+            print(f"    c_{i+1} = {val:3d}")
+        
+        print(f"  Расшифрованный вектор B ({n}×1):")
+        for i, val in enumerate(B):
+            print(f"    b_{i+1} = {val:3d}  (буква '{ALPHABET[val-1]}')")
+    
+    print("=" * 80)
+
+
+def _fits_int64(key_matrix, max_value):
+    """
+    Проверяет, что A · B не переполнит int64, если элементы B по модулю
+    не больше max_value: |c_i| <= n · max|a_ij| · max_value
+    """
+    n = key_matrix.shape[1]
+    max_key = max((abs(int(value)) for value in key_matrix.flat), default=0)
+    return n * max_key * max_value < 2 ** 63
+
+
+def matrix_encrypt_array(indices, key_matrix):
+    """
+    Шифрует массив индексов одним матричным умножением
+    
+    Индексы дополняются до кратности n и раскладываются в матрицу
+    B размером n×N (по блоку в столбце), затем C = A · B.
+    Если произведение может переполнить int64 (большие элементы ключа),
+    вычисление идёт в целых числах Python без переполнения.
+    Возвращает одномерный массив индексов шифртекста (блок за блоком).
+    """
+    m, n = key_matrix.shape
+    indices = pad_index_array(indices, n)
+    
+    max_index = int(np.abs(indices).max()) if len(indices) else 0
+    if _fits_int64(key_matrix, max_index):
+        key = np.asarray(key_matrix, dtype=np.int64)
+        blocks = indices.astype(np.int64).reshape(-1, n).T
+    else:
+        key = np.asarray(key_matrix).astype(object)
+        blocks = indices.astype(object).reshape(-1, n).T
+    
+    return (key @ blocks).T.ravel()
+
+
+def matrix_decrypt_array(encrypted_indices, matrix_inv):
+    """
+    Расшифровывает массив индексов одним матричным умножением
+    B = A^(-1) · C (по модулю 32)
+    
+    Шифртекст сначала приводится по модулю 32, поэтому произведение
+    не превышает n · 31 · 31 и всегда помещается в int64.
+    Возвращает одномерный массив индексов в диапазоне 1-32.
+    """
+    n = matrix_inv.shape[0]
+    encrypted = pad_index_array(encrypted_indices, n)
+    if encrypted.dtype == object:
+        encrypted = encrypted % ALPHABET_SIZE
+    encrypted = encrypted.astype(np.int64) % ALPHABET_SIZE
+    
+    blocks = encrypted.reshape(-1, n).T
+    B = (np.asarray(matrix_inv, dtype=np.int64) @ blocks) % ALPHABET_SIZE
+    
+    # Приводим к диапазону 1-32
+    return ((B.T.ravel() - 1) % ALPHABET_SIZE) + 1
+
+
+def matrix_encrypt(text, key_matrix, trace=None):
+    """
+    Шифрует текст матричным шифром
+    
+    Согласно примеру из скриншота:
+    C = A · B
+    где A - матрица-ключ (m×n)
+        B - вертикальный вектор индексов (n×1)
+        C - результат (m×1)
+    
+    Компоненты вектора C вычисляются так:
+    c_i = a_i1·b_1 + a_i2·b_2 + ... + a_in·b_n
+    
+    ВАЖНО: результат НЕ берется по модулю!
+    
+    Все блоки шифруются сразу (см. matrix_encrypt_array).
+    
+    trace - необязательная функция trace(key_matrix, indices, encrypted_indices)
+            для вывода хода шифрования (например, print_encrypt_trace)
+    """
+    # Преобразуем текст в индексы (с 1) и дополняем до кратности n
+    indices = pad_index_array(text_to_index_array(text), key_matrix.shape[1])
+    
+    encrypted_indices = matrix_encrypt_array(indices, key_matrix).tolist()
+    
+    if trace is not None:
+        trace(key_matrix, indices.tolist(), encrypted_indices)
+    
+    return encrypted_indices
+
+
+def matrix_decrypt(encrypted_indices, key_matrix, trace=None):
+    """
+    Расшифровывает последовательность индексов
+    
+    Для расшифрования нужна обратная матрица A^(-1)
+    B = A^(-1) · C (по модулю 32)
+    
+    Все блоки расшифровываются сразу (см. matrix_decrypt_array).
+    
+    trace - необязательная функция trace(matrix_inv, encrypted_indices, decrypted_indices)
+            для вывода хода расшифрования (например, print_decrypt_trace)
+    
+    ValueError - если матрица не квадратная или не обратима по модулю 32.
+    """
+    # Определяем размеры матрицы
+    m, n = key_matrix.shape
+    
+    # Проверяем, что матрица квадратная
+    if m != n:
+        raise ValueError("Для расшифрования матрица должна быть квадратной")
+    
+    # Находим обратную матрицу по модулю 32
+    matrix_inv, success = matrix_mod_inverse(key_matrix, ALPHABET_SIZE)
+    
+    if not success:
+        raise ValueError("Невозможно найти обратную матрицу по модулю 32")
+    
+    # Дополняем до кратности m (целые Python - шифртекст может быть большим)
+    encrypted_indices = pad_index_array(np.array(list(encrypted_indices), dtype=object), m)
+    
+    decrypted_indices = matrix_decrypt_array(encrypted_indices, matrix_inv).tolist()
+    
+    if trace is not None:
+        trace(matrix_inv, encrypted_indices.tolist(), decrypted_indices)
+    
+    return decrypted_indices
@@ -0,0 +1,117 @@
+"""
+Восстановление ключа матричного шифра по известному открытому тексту
+
+Если известны n блоков открытого текста P_1..P_n и соответствующие им
+блоки шифртекста C_1..C_n, а матрица P = [P_1 ... P_n] (блоки - столбцы)
+обратима по модулю 32, то C = K · P и ключ находится как
+K = C · P^(-1) mod 32.
+
+Матрица обратима по модулю 32 тогда и только тогда, когда её определитель
+нечётен, то есть когда она обратима по модулю 2. Поэтому блоки
+отбираются по одному: блок берётся, если его вектор по модулю 2 линейно
+независим от уже выбранных (метод Гаусса над GF(2) на битовых масках),
+и поиск останавливается на первых n таких блоках.
+
+Восстанавливается ключ по модулю 32 - его достаточно для расшифрования.
+"""
+import time
+
+import numpy as np
+
+from .hill import ALPHABET_SIZE, matrix_mod_inverse, pad_index_array, text_to_index_array
+
+
+def _to_indices(data):
+    """Текст переводится в индексы (с 1), последовательность чисел - в массив"""
+    if isinstance(data, str):
+        return text_to_index_array(data)
+    return np.array(list(data), dtype=object)
+
+
+def select_invertible_blocks(plain_blocks):
+    """
+    Выбирает номера n блоков, образующих обратимую по модулю 32 матрицу
+    plain_blocks - матрица N×n (по блоку в строке)
+    Возвращает список номеров блоков или None, если таких n блоков нет.
+    """
+    n = plain_blocks.shape[1]
+    basis = {}  # старший бит -> вектор по модулю 2 (битовая маска)
+    chosen = []
+
+    for number, block in enumerate(plain_blocks):
+        vector = 0
+        for value in block:
+            vector = (vector << 1) | (int(value) & 1)
+
+        # Приводим вектор по уже выбранному базису
+        while vector:
+            top = vector.bit_length() - 1
+            if top not in basis:
+                basis[top] = vector
+                chosen.append(number)
+                break
+            vector ^= basis[top]
+
+        if len(chosen) == n:
+            return chosen
+
+    return None
+
+
+def recover_key(plaintext, cipher_indices, n):
+    """
+    Восстанавливает матрицу-ключ n×n по открытому тексту и шифртексту
+
+    plaintext - открытый текст (строка) или его индексы (с 1)
+    cipher_indices - индексы шифртекста (результат matrix_encrypt)
+
+    Возвращает (ключ по модулю 32, номера использованных блоков);
+    если ключ восстановить нельзя - (None, []).
+    """
+    plain = pad_index_array(_to_indices(plaintext), n)
+    cipher = _to_indices(cipher_indices)
+
+    blocks = min(len(plain), len(cipher)) // n
+    if blocks < n:
+        return None, []
+
+    plain_blocks = (plain[:blocks * n] % ALPHABET_SIZE).astype(np.int64).reshape(blocks, n)
+    cipher_blocks = (cipher[:blocks * n] % ALPHABET_SIZE).astype(np.int64).reshape(blocks, n)
+
+    chosen = select_invertible_blocks(plain_blocks)
+    if chosen is None:
+        return None, []
+
+    # Блоки - столбцы матриц P и C
+    P = plain_blocks[chosen].T
+    C = cipher_blocks[chosen].T
+    P_inv, success = matrix_mod_inverse(P, ALPHABET_SIZE)
+    if not success:
+        return None, []
+
+    key = (C @ P_inv) % ALPHABET_SIZE
+
+    # Проверяем ключ на всех известных блоках
+    if not np.array_equal((key @ plain_blocks.T) % ALPHABET_SIZE, cipher_blocks.T):
+        return None, []
+
+    return key, chosen
+
+
+def recover_key_any_size(plaintext, cipher_indices, sizes=range(2, 11)):
+    """
+    Перебирает размеры ключа и возвращает первый подошедший
+    Возвращает (ключ, номера блоков, размер) или (None, [], None)
+    """
+    for n in sizes:
+        key, chosen = recover_key(plaintext, cipher_indices, n)
+        if key is not None:
+            return key, chosen, n
+    return None, [], None
+
+
+def timed_recover_key(plaintext, cipher_indices, n):
+    """Как recover_key, но дополнительно возвращает время поиска в секундах"""
+    start = time.perf_counter()
+    key, chosen = recover_key(plaintext, cipher_indices, n)
+    return key, chosen, time.perf_counter() - start
@@ -0,0 +1,129 @@
+"""
+Генерация случайных обратимых ключей матричного шифра
+
+Матрица обратима по модулю 32 тогда и только тогда, когда её
+определитель нечётен. Чётность определителя - это обратимость матрицы
+по модулю 2, которая проверяется точно методом Гаусса над GF(2)
+сразу для целой пачки матриц средствами NumPy.
+
+Режимы генерации:
+    dense      - случайные матрицы 0..31, отбор по нечётному определителю
+    sparse     - переставленная треугольная матрица с нечётной диагональю
+                 и небольшим числом внедиагональных элементов
+    unimodular - произведение элементарных преобразований строк
+                 с коэффициентами ±1 (определитель ±1, малые элементы)
+В режимах sparse и unimodular ключ обратим по построению и содержит
+мало ненулевых элементов или только малые элементы, поэтому
+шифрование таким ключом дешевле.
+"""
+import numpy as np
+
+from .hill import ALPHABET_SIZE
+
+KEY_MODES = ("dense", "sparse", "unimodular")
+
+
+def is_invertible_mod2_batch(matrices):
+    """
+    Для пачки матриц формы (B, n, n) возвращает массив bool формы (B,):
+    True, если определитель нечётен (матрица обратима по модулю 32)
+    """
+    a = (np.asarray(matrices) & 1).astype(np.uint8)
+    count, n, _ = a.shape
+    invertible = np.ones(count, dtype=bool)
+    batch = np.arange(count)
+
+    for col in range(n):
+        column = a[:, col:, col]
+        invertible &= column.any(axis=1)
+
+        # Переставляем строку с единицей в столбце col на место col
+        pivot = col + column.argmax(axis=1)
+        pivot_rows = a[batch, pivot].copy()
+        a[batch, pivot] = a[batch, col]
+        a[batch, col] = pivot_rows
+
+        # Обнуляем столбец col ниже ведущей строки (сложение по модулю 2)
+        below = a[:, col + 1:, col:col + 1]
+        a[:, col + 1:, :] ^= below * a[:, col:col + 1, :]
+
+    return invertible
+
+
+def _dense_keys(count, n, rng):
+    """Случайные матрицы с элементами 0..31 с отбором по чётности определителя"""
+    found = [np.empty((0, n, n), dtype=np.int64)]
+    total = 0
+    while total < count:
+        # Доля обратимых над GF(2) матриц не меньше ~0.29, берём с запасом
+        batch = rng.integers(0, ALPHABET_SIZE, size=(max(4 * (count - total), 16), n, n))
+        good = batch[is_invertible_mod2_batch(batch)]
+        found.append(good)
+        total += len(good)
+    return np.concatenate(found)[:count]
+
+
+def _sparse_keys(count, n, rng, extra):
+    """
+    P · T, где T - верхнетреугольная матрица с нечётной диагональю
+    и extra случайными элементами над диагональю, P - перестановка строк
+    Определитель равен ±(произведение диагонали), то есть нечётен
+    """
+    keys = np.zeros((count, n, n), dtype=np.int64)
+    diagonal = np.arange(n)
+    keys[:, diagonal, diagonal] = 2 * rng.integers(0, ALPHABET_SIZE // 2, size=(count, n)) + 1
+
+    upper_rows, upper_cols = np.triu_indices(n, k=1)
+    if len(upper_rows) and extra:
+        batch = np.repeat(np.arange(count), extra)
+        positions = rng.integers(0, len(upper_rows), size=count * extra)
+        keys[batch, upper_rows[positions], upper_cols[positions]] = rng.integers(
+            1, ALPHABET_SIZE, size=count * extra
+        )
+
+    permutations = np.argsort(rng.random((count, n)), axis=1)
+    return np.take_along_axis(keys, permutations[:, :, np.newaxis], axis=1)
+
+
+def _unimodular_keys(count, n, rng, extra):
+    """
+    Произведение extra элементарных преобразований строк r_i += ±r_j
+    (i ≠ j) над единичной матрицей: определитель равен 1
+    """
+    keys = np.broadcast_to(np.eye(n, dtype=np.int64), (count, n, n)).copy()
+    if n < 2:
+        return keys
+
+    batch = np.arange(count)
+    for _ in range(extra):
+        target = rng.integers(0, n, size=count)
+        source = (target + rng.integers(1, n, size=count)) % n
+        sign = rng.choice(np.array([-1, 1]), size=count)
+        keys[batch, target] += sign[:, np.newaxis] * keys[batch, source]
+    return keys
+
+
+def generate_invertible_keys(count, n, mode="dense", seed=None, extra=None):
+    """
+    Генерирует count случайных ключей n×n, обратимых по модулю 32
+
+    mode - режим генерации: dense, sparse или unimodular (см. описание модуля)
+    seed - начальное значение генератора для воспроизводимых наборов
+    extra - для sparse: число внедиагональных элементов,
+            для unimodular: число элементарных преобразований (по умолчанию n)
+
+    Возвращает массив формы (count, n, n) со значениями np.int64.
+    """
+    if mode not in KEY_MODES:
+        raise ValueError(f"Неизвестный режим генерации ключей: {mode} (доступны: {', '.join(KEY_MODES)})")
+    if count < 0 or n < 1:
+        raise ValueError("Число ключей должно быть неотрицательным, а размер - положительным")
+
+    rng = np.random.default_rng(seed)
+    extra = n if extra is None else extra
+
+    if mode == "dense":
+        return _dense_keys(count, n, rng)
+    if mode == "sparse":
+        return _sparse_keys(count, n, rng, extra)
+    return _unimodular_keys(count, n, rng, extra)
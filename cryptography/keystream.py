@@ -0,0 +1,54 @@
+"""
+Источник случайных букв (гаммы) для русского алфавита из 32 букв
+
+Буквы получаются из случайных байт: 32 делит 256, поэтому byte & 31
+даёт равномерно распределённую букву без отбраковки, а перевод целого
+буфера байт в буквы выполняется одним вызовом bytes.translate.
+
+По умолчанию байты берутся из os.urandom (криптостойкий источник ОС).
+KeyStream(seed) выдаёт детерминированную последовательность из
+random.Random(seed) - только для воспроизводимых тестов и примеров.
+"""
+import os
+import random
+
+# Русский алфавит без Ё (32 буквы)
+ALPHABET = "АБВГДЕЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ"
+
+# Таблица для bytes.translate: байт -> буква в кодировке cp1251
+_LETTER_TABLE = ALPHABET.encode('cp1251') * 8
+
+
+class KeyStream:
+    """
+    Поток случайных байт и букв
+    seed=None - криптостойкий поток (os.urandom),
+    иначе - воспроизводимый поток random.Random(seed)
+    """
+
+    def __init__(self, seed=None):
+        self._random = None if seed is None else random.Random(seed)
+
+    @property
+    def deterministic(self):
+        """True, если поток задан начальным значением"""
+        return self._random is not None
+
+    def random_bytes(self, count):
+        """count случайных байт"""
+        if self._random is None:
+            return os.urandom(count)
+        return self._random.randbytes(count)
+
+    def letters(self, count):
+        """Строка из count случайных букв алфавита"""
+        return self.random_bytes(count).translate(_LETTER_TABLE).decode('cp1251')
+
+
+# Общий криптостойкий поток по умолчанию
+SECURE = KeyStream()
+
+
+def random_letters(count, stream=None):
+    """Строка из count случайных букв (по умолчанию - из криптостойкого потока)"""
+    return (stream or SECURE).letters(count)
@@ -0,0 +1,504 @@
+"""
+Блочный шифр МАГМА (ГОСТ Р 34.12-2015)
+
+Magma(key) разворачивает 256-битный ключ в 32 итерационных ключа один
+раз и хранит их в компактном array('I'); get_magma возвращает такой
+объект из кэша, так что повторная работа с тем же ключом не повторяет
+разбор ключа.
+
+magma_encrypt и magma_decrypt повторяют формулы стандарта раунд за раундом;
+magma_encrypt_unrolled и magma_decrypt_unrolled дают тот же результат
+одной функцией с развёрнутыми раундами и используются режимами работы
+и объектом Magma.
+"""
+import struct
+from array import array
+from functools import lru_cache
+
+BLOCK_SIZE = 8
+KEY_SIZE = 32
+
+# Сколько развёрнутых ключей хранится в кэше get_magma
+MAGMA_CACHE_SIZE = 1024
+
+# Таблицы замен (S-блоки) для алгоритма МАГМА согласно ГОСТ Р 34.12-2015
+PI = [
+    [12, 4, 6, 2, 10, 5, 11, 9, 14, 8, 13, 7, 0, 3, 15, 1],
+    [6, 8, 2, 3, 9, 10, 5, 12, 1, 14, 4, 7, 11, 13, 0, 15],
+    [11, 3, 5, 8, 2, 15, 10, 13, 14, 1, 7, 4, 12, 9, 6, 0],
+    [12, 8, 2, 1, 13, 4, 15, 6, 7, 0, 10, 5, 3, 14, 9, 11],
+    [7, 15, 5, 10, 8, 1, 6, 13, 0, 9, 3, 14, 11, 4, 2, 12],
+    [5, 13, 15, 6, 9, 2, 12, 10, 11, 7, 8, 1, 4, 3, 14, 0],
+    [8, 14, 2, 5, 6, 9, 1, 12, 15, 4, 11, 0, 13, 10, 3, 7],
+    [1, 7, 14, 13, 0, 5, 8, 3, 4, 15, 10, 6, 9, 12, 11, 2]
+]
+
+
+def is_valid_hex(text, expected_length):
+    """Проверяет, является ли строка валидной HEX строкой нужной длины"""
+    if len(text) != expected_length:
+        return False
+    try:
+        int(text, 16)
+        return True
+    except ValueError:
+        return False
+
+
+def t_transform(a):
+    """
+    Преобразование t: V32 → V32
+    Применяет таблицы замен (S-блоки) согласно формуле (14)
+    """
+    result = 0
+    for i in range(8):
+        nibble = (a >> (4 * i)) & 0x0F
+        substituted = PI[i][nibble]
+        result |= (substituted << (4 * i))
+    return result
+
+
+def rotate_left_11(value):
+    """Циклический сдвиг влево на 11 бит для 32-битного числа"""
+    value &= 0xFFFFFFFF
+    return ((value << 11) | (value >> 21)) & 0xFFFFFFFF
+
+
+def build_g_tables():
+    """
+    Строит 4 таблицы по 256 элементов для быстрого преобразования g
+
+    Таблица j объединяет соседние S-блоки PI[2j] и PI[2j+1] (один байт)
+    и уже содержит циклический сдвиг на 11 бит. Так как t заменяет
+    тетрады независимо, а сдвиг линеен относительно ⊕, то
+    t(x)⋘11 = T0[x0] ⊕ T1[x1] ⊕ T2[x2] ⊕ T3[x3], где xj - байты x
+    """
+    tables = []
+    for j in range(4):
+        table = []
+        for byte in range(256):
+            low = PI[2 * j][byte & 0x0F]
+            high = PI[2 * j + 1][byte >> 4]
+            table.append(rotate_left_11(((high << 4) | low) << (8 * j)))
+        tables.append(table)
+    return tables
+
+
+# Байтовые таблицы замен со встроенным сдвигом на 11 бит
+T0, T1, T2, T3 = build_g_tables()
+
+
+def g_transform_reference(k, a):
+    """
+    Преобразование g[k]: V32 → V32 согласно формуле (15)
+    g[k](a) = (t(Vec32(Int32(a) ⊞ Int32(k)))) ⋘11
+    Эталонная реализация: 8 замен по тетрадам, затем сдвиг
+    """
+    temp = (a + k) & 0xFFFFFFFF
+    temp = t_transform(temp)
+    temp = rotate_left_11(temp)
+    return temp
+
+
+def g_transform(k, a):
+    """
+    Преобразование g[k]: V32 → V32 согласно формуле (15)
+    Табличная реализация: 4 замены по байтам с уже выполненным сдвигом
+    """
+    x = (a + k) & 0xFFFFFFFF
+    return T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+
+
+def G_transform(k, a1, a0):
+    """
+    Преобразование G[k]: V32 × V32 → V32 × V32 согласно формуле (16)
+    G[k](a1, a0) = (a0, g[k](a0) ⊕ a1)
+    """
+    new_a1 = a0
+    new_a0 = g_transform(k, a0) ^ a1
+    return new_a1, new_a0
+
+
+def G_star_transform(k, a1, a0):
+    """
+    Преобразование G*[k]: V32 × V32 → V64 согласно формуле (17)
+    G*[k](a1, a0) = (g[k](a0) ⊕ a1)||a0
+    """
+    result_high = g_transform(k, a0) ^ a1
+    result_low = a0
+    return result_high, result_low
+
+
+def expand_key(key):
+    """
+    Разворачивает 256-битный ключ (32 байта) в 32 итерационных ключа
+    согласно формуле (18) ГОСТ Р 34.12-2015, результат - array('I')
+    """
+    if len(key) != KEY_SIZE:
+        raise ValueError(f"Ключ должен быть длиной {KEY_SIZE} байта (256 бит)")
+
+    # 8 подключей по 32 бита: K1...K8 трижды, затем K8...K1
+    subkeys = array('I', struct.unpack('>8I', key))
+    return subkeys * 3 + subkeys[::-1]
+
+
+def generate_round_keys(key_hex):
+    """
+    Генерирует 32 итерационных ключа из 256-битного ключа (HEX)
+    согласно формуле (18) ГОСТ Р 34.12-2015
+    """
+    key_bytes = bytes.fromhex(key_hex)
+    
+    if len(key_bytes) != KEY_SIZE:
+        raise ValueError("Ключ должен быть длиной 64 символа HEX (256 бит)")
+    
+    return list(expand_key(key_bytes))
+
+
+def magma_encrypt(a, round_keys):
+    """
+    Шифрует 64-битное число алгоритмом МАГМА
+    Согласно формуле (19): E = G*[K32]G[K31]...G[K2]G[K1](a1, a0)
+    """
+    if isinstance(a, str):
+        a = int(a, 16)
+    
+    # Разбиваем на две 32-битные части
+    a1 = (a >> 32) & 0xFFFFFFFF
+    a0 = a & 0xFFFFFFFF
+    
+    # 31 раунд с преобразованием G
+    for i in range(31):
+        a1, a0 = G_transform(round_keys[i], a1, a0)
+    
+    # 32-й раунд с преобразованием G*
+    b1, b0 = G_star_transform(round_keys[31], a1, a0)
+    
+    # Объединяем результат
+    b = (b1 << 32) | b0
+    
+    return b
+
+
+def magma_decrypt(b, round_keys):
+    """
+    Расшифровывает 64-битное число алгоритмом МАГМА
+    Согласно формуле (20): D = G*[K1]G[K2]...G[K31]G[K32](a1, a0)
+    """
+    if isinstance(b, str):
+        b = int(b, 16)
+    
+    # Разбиваем на две 32-битные части
+    b1 = (b >> 32) & 0xFFFFFFFF
+    b0 = b & 0xFFFFFFFF
+    
+    # 31 раунд с преобразованием G (ключи K32, K31, ..., K2)
+    for i in range(31, 0, -1):
+        b1, b0 = G_transform(round_keys[i], b1, b0)
+    
+    # 32-й раунд с преобразованием G* (ключ K1)
+    a1, a0 = G_star_transform(round_keys[0], b1, b0)
+    
+    # Объединяем результат
+    a = (a1 << 32) | a0
+    
+    return a
+
+
+def magma_encrypt_unrolled(a, round_keys, T0=T0, T1=T1, T2=T2, T3=T3):
+    """
+    Шифрует 64-битное число (результат совпадает с magma_encrypt)
+    Все 32 раунда развёрнуты, итерационные ключи и таблицы замен -
+    локальные переменные (T0..T3 не передаются, это привязка таблиц),
+    половины блока обновляются на месте без кортежей: раунд с нечётным
+    номером пишет в a1, с чётным - в a0, поэтому перестановка половин
+    не нужна, а после 32-го раунда (G*) старшая половина - в a0.
+    """
+    (k0, k1, k2, k3, k4, k5, k6, k7, k8, k9, k10, k11, k12, k13, k14, k15,
+     k16, k17, k18, k19, k20, k21, k22, k23, k24, k25, k26, k27, k28, k29, k30, k31) = round_keys
+    a1 = (a >> 32) & 0xFFFFFFFF
+    a0 = a & 0xFFFFFFFF
+    x = (a0 + k0) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k1) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k2) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k3) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k4) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k5) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k6) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k7) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k8) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k9) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k10) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k11) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k12) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k13) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k14) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k15) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k16) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k17) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k18) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k19) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k20) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k21) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k22) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k23) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k24) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k25) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k26) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k27) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k28) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k29) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k30) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k31) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    return (a0 << 32) | a1
+
+
+def magma_decrypt_unrolled(b, round_keys, T0=T0, T1=T1, T2=T2, T3=T3):
+    """
+    Расшифровывает 64-битное число (результат совпадает с magma_decrypt)
+    Те же развёрнутые раунды с ключами K32, ..., K1
+    """
+    (k0, k1, k2, k3, k4, k5, k6, k7, k8, k9, k10, k11, k12, k13, k14, k15,
+     k16, k17, k18, k19, k20, k21, k22, k23, k24, k25, k26, k27, k28, k29, k30, k31) = round_keys
+    a1 = (b >> 32) & 0xFFFFFFFF
+    a0 = b & 0xFFFFFFFF
+    x = (a0 + k31) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k30) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k29) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k28) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k27) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k26) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k25) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k24) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k23) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k22) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k21) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k20) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k19) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k18) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k17) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k16) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k15) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k14) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k13) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k12) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k11) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k10) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k9) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k8) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k7) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k6) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k5) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k4) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k3) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k2) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a0 + k1) & 0xFFFFFFFF
+    a1 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    x = (a1 + k0) & 0xFFFFFFFF
+    a0 ^= T0[x & 0xFF] ^ T1[(x >> 8) & 0xFF] ^ T2[(x >> 16) & 0xFF] ^ T3[x >> 24]
+    return (a0 << 32) | a1
+
+
+class Magma:
+    """
+    Шифр МАГМА с развёрнутым ключом
+    key - ключ 32 байта (bytes, bytearray, memoryview)
+    Блок - 64-битное число или 8 байт (big-endian), результат того же типа.
+    """
+
+    __slots__ = ("key", "round_keys")
+
+    def __init__(self, key):
+        self.key = bytes(key)
+        self.round_keys = expand_key(self.key)
+
+    def encrypt_block(self, block):
+        """Шифрует один блок"""
+        if isinstance(block, int):
+            return magma_encrypt_unrolled(block, self.round_keys)
+        return magma_encrypt_unrolled(_block_to_int(block), self.round_keys).to_bytes(BLOCK_SIZE, 'big')
+
+    def decrypt_block(self, block):
+        """Расшифровывает один блок"""
+        if isinstance(block, int):
+            return magma_decrypt_unrolled(block, self.round_keys)
+        return magma_decrypt_unrolled(_block_to_int(block), self.round_keys).to_bytes(BLOCK_SIZE, 'big')
+
+
+def _block_to_int(block):
+    """8 байт блока в число big-endian"""
+    if len(block) != BLOCK_SIZE:
+        raise ValueError(f"Блок должен быть длиной {BLOCK_SIZE} байт")
+    return int.from_bytes(block, 'big')
+
+
+@lru_cache(maxsize=MAGMA_CACHE_SIZE)
+def _compiled_magma(key):
+    return Magma(key)
+
+
+def get_magma(key):
+    """
+    Возвращает объект Magma для ключа (bytes или HEX-строка)
+    из кэша (последние MAGMA_CACHE_SIZE ключей, вытеснение по LRU)
+    """
+    if isinstance(key, str):
+        key = bytes.fromhex(key)
+    return _compiled_magma(bytes(key))
+
+
+def test_gost_example():
+    """
+    Тестирует алгоритм на контрольном примере из ГОСТ Р 34.12-2015
+    Приложение А.2
+    """
+    print("=" * 80)
+    print("ТЕСТИРОВАНИЕ НА КОНТРОЛЬНОМ ПРИМЕРЕ ИЗ ГОСТ Р 34.12-2015 (А.2)")
+    print("=" * 80)
+    
+    # Ключ из примера A.2.3
+    K = "ffeeddccbbaa99887766554433221100f0f1f2f3f4f5f6f7f8f9fafbfcfdfeff"
+    
+    print(f"\nКлюч (256 бит):\n{K}")
+    
+    # Генерируем раундовые ключи
+    round_keys = generate_round_keys(K)
+    
+    # Проверяем раундовые ключи (A.2.3)
+    expected_keys = {
+        1: 0xffeeddcc, 9: 0xffeeddcc, 17: 0xffeeddcc, 25: 0xfcfdfeff,
+        2: 0xbbaa9988, 10: 0xbbaa9988, 18: 0xbbaa9988, 26: 0xf8f9fafb,
+        3: 0x77665544, 11: 0x77665544, 19: 0x77665544, 27: 0xf4f5f6f7,
+        4: 0x33221100, 12: 0x33221100, 20: 0x33221100, 28: 0xf0f1f2f3,
+        5: 0xf0f1f2f3, 13: 0xf0f1f2f3, 21: 0xf0f1f2f3, 29: 0x33221100,
+        6: 0xf4f5f6f7, 14: 0xf4f5f6f7, 22: 0xf4f5f6f7, 30: 0x77665544,
+        7: 0xf8f9fafb, 15: 0xf8f9fafb, 23: 0xf8f9fafb, 31: 0xbbaa9988,
+        8: 0xfcfdfeff, 16: 0xfcfdfeff, 24: 0xfcfdfeff, 32: 0xffeeddcc
+    }
+    
+    print("\nПроверка раундовых ключей:")
+    all_correct = True
+    for i in sorted(expected_keys.keys()):
+        expected = expected_keys[i]
+        actual = round_keys[i-1]
+        status = "✓" if actual == expected else "✗"
+        print(f"  K{i:2d} = {actual:08x} (ожидается {expected:08x}) {status}")
+        if actual != expected:
+            all_correct = False
+    
+    if not all_correct:
+        print("\nОШИБКА: Раундовые ключи не совпадают!")
+        return False
+    
+    print("\nВсе раундовые ключи совпадают!")
+    
+    # Открытый текст из примера A.2.4
+    a = 0xfedcba9876543210
+    
+    print(f"\n{'-'*80}")
+    print("ШИФРОВАНИЕ:")
+    print(f"Открытый текст (64 бит):    {a:016x}")
+    
+    a1 = (a >> 32) & 0xFFFFFFFF
+    a0 = a & 0xFFFFFFFF
+    print(f"  (a1, a0) = ({a1:08x}, {a0:08x})")
+    
+    # Шифрование
+    b = magma_encrypt(a, round_keys)
+    
+    print(f"\nЗашифрованный текст:        {b:016x}")
+    print(f"Ожидается по ГОСТ:          4ee901e5c2d8ca3d")
+    
+    if b == 0x4ee901e5c2d8ca3d:
+        print("ШИФРОВАНИЕ УСПЕШНО!")
+    else:
+        print("ОШИБКА ШИФРОВАНИЯ!")
+        return False
+    
+    # Расшифрование
+    print(f"\n{'-'*80}")
+    print("РАСШИФРОВАНИЕ:")
+    print(f"Зашифрованный текст:        {b:016x}")
+    
+    d = magma_decrypt(b, round_keys)
+    
+    print(f"Расшифрованный текст:       {d:016x}")
+    print(f"Ожидается (исходный текст): {a:016x}")
+    
+    if d == a:
+        print("РАСШИФРОВАНИЕ УСПЕШНО!")
+
+        # Развёрнутая реализация должна давать те же результаты
+        if magma_encrypt_unrolled(a, round_keys) != b or magma_decrypt_unrolled(b, round_keys) != a:
+            print("ОШИБКА: развёрнутая реализация не совпадает с эталонной!")
+            return False
+        print("Развёрнутая реализация (magma_encrypt_unrolled) совпадает с эталонной.")
+        print("\n" + "=" * 80)
+        print("ВСЕ ТЕСТЫ ПРОЙДЕНЫ! АЛГОРИТМ РАБОТАЕТ КОРРЕКТНО!")
+        print("=" * 80)
+        return True
+    else:
+        print("ОШИБКА РАСШИФРОВАНИЯ!")
+        return False
@@ -0,0 +1,101 @@
+"""
+Параллельный режим гаммирования (CTR) МАГМА на нескольких ядрах
+
+Данные делятся на части, выровненные по границе блока, и каждая часть
+шифруется в отдельном процессе со своим начальным значением счётчика.
+Итерационные ключи и синхропосылка передаются процессам один раз
+при запуске пула, а не с каждой частью.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .magma_modes import BLOCK_SIZE, ctr_crypt
+
+# Размер части по умолчанию - 1 МБ (кратен размеру блока)
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Состояние процесса-исполнителя, заполняется в _init_worker
+_worker_round_keys = None
+_worker_iv = None
+
+
+def _init_worker(round_keys, iv):
+    """Сохраняет ключи и синхропосылку в процессе-исполнителе"""
+    global _worker_round_keys, _worker_iv
+    _worker_round_keys = round_keys
+    _worker_iv = iv
+
+
+def _crypt_chunk(task):
+    """Шифрует одну часть; task = (номер первого блока, данные)"""
+    start_block, chunk = task
+    return ctr_crypt(chunk, _worker_round_keys, _worker_iv, start_block)
+
+
+def _check_chunk_size(chunk_size):
+    """Часть должна содержать целое число блоков"""
+    if chunk_size <= 0 or chunk_size % BLOCK_SIZE != 0:
+        raise ValueError(f"Размер части должен быть положительным и кратным {BLOCK_SIZE} байтам")
+
+
+def _run_ordered(executor, tasks, window):
+    """
+    Отправляет задачи в пул, держа в работе не более window частей,
+    и выдаёт результаты строго в порядке поступления задач
+    """
+    pending = deque()
+    for task in tasks:
+        pending.append(executor.submit(_crypt_chunk, task))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def ctr_crypt_parallel(data, round_keys, iv, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Режим гаммирования (CTR) с распределением частей по процессам
+    Результат побайтно совпадает с ctr_crypt(data, round_keys, iv)
+
+    workers - число процессов (по умолчанию - число ядер)
+    chunk_size - размер части в байтах, кратный 8
+    """
+    _check_chunk_size(chunk_size)
+    workers = workers or os.cpu_count() or 1
+    view = memoryview(data)
+
+    tasks = (
+        (offset // BLOCK_SIZE, bytes(view[offset:offset + chunk_size]))
+        for offset in range(0, len(view), chunk_size)
+    )
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(round_keys, bytes(iv))) as executor:
+        return b"".join(_run_ordered(executor, tasks, 2 * workers))
+
+
+def ctr_crypt_file_parallel(src_path, dst_path, round_keys, iv, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Шифрует (расшифровывает) файл в режиме CTR на нескольких ядрах
+    В памяти одновременно находится не более 2 * workers частей,
+    поэтому размер файла не ограничен объёмом памяти.
+    Возвращает число обработанных байт.
+    """
+    _check_chunk_size(chunk_size)
+    workers = workers or os.cpu_count() or 1
+
+    def read_tasks(src):
+        start_block = 0
+        while True:
+            chunk = src.read(chunk_size)
+            if not chunk:
+                return
+            yield start_block, chunk
+            start_block += len(chunk) // BLOCK_SIZE
+
+    total = 0
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst, \
+            ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(round_keys, bytes(iv))) as executor:
+        for result in _run_ordered(executor, read_tasks(src), 2 * workers):
+            dst.write(result)
+            total += len(result)
+    return total
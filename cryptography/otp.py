@@ -0,0 +1,122 @@
+"""
+Шифр гаммирования (шифр Вернама/Шеннона) для русского алфавита
+"""
+from .keystream import random_letters
+
+# Русский алфавит без Ё (32 буквы)
+ALPHABET = "АБВГДЕЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ"
+
+# Индекс буквы; символ вне алфавита даёт -1, как ALPHABET.find
+_INDEX = {char: index for index, char in enumerate(ALPHABET)}
+
+
+def generate_key(length, stream=None):
+    """
+    Генерирует случайный ключ заданной длины
+    stream - источник букв KeyStream (по умолчанию криптостойкий,
+             KeyStream(seed) - воспроизводимый ключ для тестов)
+    """
+    return random_letters(length, stream)
+
+
+def normalize_text(text):
+    """Нормализует текст: убирает пробелы, приводит к верхнему регистру"""
+    text = text.upper().replace("Ё", "Е")
+    # Убираем все символы кроме букв алфавита
+    return "".join([char for char in text if char in _INDEX])
+
+
+def print_encrypt_trace(text, key, result):
+    """Выводит подробный ход шифрования (первые 10 и последние 3 символа)"""
+    print("\n" + "=" * 80)
+    print("ПРОЦЕСС ШИФРОВАНИЯ")
+    print("=" * 80)
+    print(f"\nФормула: C = (P + K) mod {len(ALPHABET)}")
+    print("\nПосимвольное шифрование:")
+    print("-" * 80)
+    
+    for i in range(len(text)):
+        if i < 10 or i >= len(text) - 3:
+            p_char, k_char, c_char = text[i], key[i], result[i]
+            p_idx = ALPHABET.find(p_char)
+            k_idx = ALPHABET.find(k_char)
+            c_idx = ALPHABET.find(c_char)
+            print(f"  [{i+1:3d}] {p_char}({p_idx:2d}) + {k_char}({k_idx:2d}) = {c_char}({c_idx:2d})  "
+                  f"[({p_idx} + {k_idx}) mod 32 = {c_idx}]")
+        elif i == 10:
+            print("  ...")
+    
+    print("-" * 80)
+
+
+def print_decrypt_trace(cipher, key, result):
+    """Выводит подробный ход расшифрования (первые 10 и последние 3 символа)"""
+    print("\n" + "=" * 80)
+    print("ПРОЦЕСС РАСШИФРОВАНИЯ")
+    print("=" * 80)
+    print(f"\nФормула: P = (C - K) mod {len(ALPHABET)}")
+    print("\nПосимвольное расшифрование:")
+    print("-" * 80)
+    
+    for i in range(len(cipher)):
+        if i < 10 or i >= len(cipher) - 3:
+            c_char, k_char, p_char = cipher[i], key[i], result[i]
+            c_idx = ALPHABET.find(c_char)
+            k_idx = ALPHABET.find(k_char)
+            p_idx = ALPHABET.find(p_char)
+            print(f"  [{i+1:3d}] {c_char}({c_idx:2d}) - {k_char}({k_idx:2d}) = {p_char}({p_idx:2d})  "
+                  f"[({c_idx} - {k_idx}) mod 32 = {p_idx}]")
+        elif i == 10:
+            print("  ...")
+    
+    print("-" * 80)
+
+
+def encrypt_otp(text, key, trace=None):
+    """
+    Шифрование текста методом гаммирования (шифр Вернама/Шеннона)
+    
+    Формула: C = (P + K) mod 32
+    где P - индекс буквы открытого текста,
+        K - индекс буквы ключа,
+        C - индекс буквы шифртекста
+    
+    trace - необязательная функция trace(text, key, result) для вывода
+            хода шифрования (например, print_encrypt_trace)
+    """
+    if len(text) != len(key):
+        raise ValueError(f"Длина текста ({len(text)}) должна равняться длине ключа ({len(key)})")
+    
+    # Складываем индексы буквы текста и буквы ключа по модулю 32
+    index = _INDEX.get
+    result = "".join([ALPHABET[(index(p, -1) + index(k, -1)) % 32] for p, k in zip(text, key)])
+    
+    if trace is not None:
+        trace(text, key, result)
+    
+    return result
+
+
+def decrypt_otp(cipher, key, trace=None):
+    """
+    Дешифрование текста методом гаммирования
+    
+    Формула: P = (C - K) mod 32
+    где C - индекс буквы шифртекста,
+        K - индекс буквы ключа,
+        P - индекс буквы открытого текста
+    
+    trace - необязательная функция trace(cipher, key, result) для вывода
+            хода расшифрования (например, print_decrypt_trace)
+    """
+    if len(cipher) != len(key):
+        raise ValueError(f"Длина шифртекста ({len(cipher)}) должна равняться длине ключа ({len(key)})")
+    
+    # Вычитаем индекс буквы ключа из индекса буквы шифртекста по модулю 32
+    index = _INDEX.get
+    result = "".join([ALPHABET[(index(c, -1) - index(k, -1)) % 32] for c, k in zip(cipher, key)])
+    
+    if trace is not None:
+        trace(cipher, key, result)
+    
+    return result
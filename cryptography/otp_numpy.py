@@ -0,0 +1,112 @@
+"""
+Шифр гаммирования над массивами NumPy
+
+Буквы алфавита идут в Юникоде подряд (А..Я без Ё, U+0410..U+042F), поэтому
+текст переводится в индексы букв одним вычитанием над кодами UTF-16:
+код - 0x410 с переполнением uint16, а всё, что вне алфавита, ограничивается
+значением 31 (как ALPHABET.find(...) = -1 по модулю 32). Затем
+(p + k) & 31 и (c - k) & 31 вычисляются сразу над всем массивом
+(32 делит 256, поэтому переполнение uint8 не мешает), и индексы
+переводятся обратно в буквы сложением с 0x410 и декодированием UTF-16.
+
+Ключ может быть строкой или буфером байт (bytes, memoryview, mmap):
+буфер используется без копирования, значащие у байта только младшие
+5 бит. vernam_xor - побайтовый шифр Вернама (XOR) для двоичных данных.
+"""
+import numpy as np
+
+from .otp import ALPHABET
+
+_FIRST = ord(ALPHABET[0])
+if ALPHABET != "".join(map(chr, range(_FIRST, _FIRST + len(ALPHABET)))):
+    raise ValueError("Буквы алфавита должны идти в Юникоде подряд")
+
+# Символы вне алфавита дают индекс 31, как ALPHABET.find(...) = -1 по модулю 32
+_MISSING = len(ALPHABET) - 1
+
+
+def text_to_indices(text):
+    """Переводит строку в массив индексов букв (uint8)"""
+    encoded = text.encode('utf-16-le', 'surrogatepass')
+    if len(encoded) == 2 * len(text):
+        codes = np.frombuffer(encoded, dtype=np.uint16)
+    else:
+        # Символы вне BMP занимают в UTF-16 по два кода
+        codes = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    indices = codes - codes.dtype.type(_FIRST)
+    np.minimum(indices, _MISSING, out=indices)
+    return indices.astype(np.uint8)
+
+
+def indices_to_text(indices):
+    """Переводит массив индексов (берутся младшие 5 бит) в строку"""
+    codes = np.bitwise_and(indices, 31, dtype=np.uint16)
+    codes += _FIRST
+    return codes.tobytes().decode('utf-16-le')
+
+
+def key_indices(key):
+    """
+    Ключ в виде массива uint8: строка переводится в индексы,
+    буфер байт оборачивается без копирования
+    """
+    if isinstance(key, str):
+        return text_to_indices(key)
+    return np.frombuffer(key, dtype=np.uint8)
+
+
+def _check_lengths(text_length, key_length, what):
+    if text_length != key_length:
+        raise ValueError(f"Длина {what} ({text_length}) должна равняться длине ключа ({key_length})")
+
+
+def encrypt_indices(plain, key, out=None):
+    """C = (P + K) mod 32 над массивами uint8; out - необязательный массив результата"""
+    out = np.add(plain, key, out=out)
+    return np.bitwise_and(out, 31, out=out)
+
+
+def decrypt_indices(cipher, key, out=None):
+    """P = (C - K) mod 32 над массивами uint8; out - необязательный массив результата"""
+    out = np.subtract(cipher, key, out=out)
+    return np.bitwise_and(out, 31, out=out)
+
+
+def encrypt_otp_fast(text, key):
+    """
+    Шифрование гаммированием всего текста сразу
+    Результат совпадает с encrypt_otp(text, key) для строкового ключа.
+    """
+    plain = text_to_indices(text)
+    key = key_indices(key)
+    _check_lengths(len(plain), len(key), "текста")
+    return indices_to_text(encrypt_indices(plain, key, out=plain))
+
+
+def decrypt_otp_fast(cipher, key):
+    """
+    Расшифрование гаммированием всего текста сразу
+    Результат совпадает с decrypt_otp(cipher, key) для строкового ключа.
+    """
+    encrypted = text_to_indices(cipher)
+    key = key_indices(key)
+    _check_lengths(len(encrypted), len(key), "шифртекста")
+    return indices_to_text(decrypt_indices(encrypted, key, out=encrypted))
+
+
+def vernam_xor(data, key, out=None):
+    """
+    Побайтовый шифр Вернама: data XOR key (шифрование и расшифрование)
+    data, key - буферы байт (bytes, bytearray, memoryview, mmap), читаются
+    без копирования; out - необязательный записываемый буфер результата
+    Возвращает out (по умолчанию - новый bytearray).
+    """
+    _check_lengths(len(data), len(key), "данных")
+    if out is None:
+        out = bytearray(len(data))
+    np.bitwise_xor(
+        np.frombuffer(data, dtype=np.uint8),
+        np.frombuffer(key, dtype=np.uint8),
+        out=np.frombuffer(out, dtype=np.uint8),
+    )
+    return out
@@ -0,0 +1,209 @@
+"""
+Файл-блокнот для шифра гаммирования
+
+Блокнот - заранее созданный файл случайных байт (create_pad). Он
+отображается в память (mmap) целиком, а ключи выдаются из него
+непересекающимися кусками по порядку. Смещение первого неизрасходованного
+байта хранится в файле-журнале рядом с блокнотом (<блокнот>.offset):
+выдача куска - это чтение смещения, проверка остатка и запись нового
+смещения на диск под исключительной блокировкой журнала (fcntl.flock,
+в Windows - msvcrt.locking). Поэтому несколько процессов, работающих
+с одним блокнотом, никогда не получат один и тот же кусок ключа, а после
+сбоя выданные куски не выдаются повторно.
+
+Кусок ключа - memoryview над отображением файла: он передаётся в
+encrypt_otp_fast и vernam_xor без копирования. Буква ключа - младшие
+5 бит байта (32 делит 256, поэтому распределение остаётся равномерным).
+"""
+import mmap
+import os
+import threading
+
+from .keystream import SECURE
+from .otp_numpy import decrypt_otp_fast, encrypt_otp_fast, vernam_xor
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+JOURNAL_SUFFIX = ".offset"
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Смещение записывается числом фиксированной ширины одной операцией записи
+_OFFSET_WIDTH = 20
+
+
+def _lock(fd):
+    """Исключительная блокировка файла (ждёт освобождения)"""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+
+def _unlock(fd):
+    """Снимает блокировку _lock"""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+def _read_offset(fd):
+    """Читает смещение из журнала (пустой журнал - 0)"""
+    os.lseek(fd, 0, os.SEEK_SET)
+    data = os.read(fd, _OFFSET_WIDTH + 2).strip()
+    return int(data) if data else 0
+
+
+def _write_offset(fd, offset):
+    """Записывает смещение в журнал и дожидается записи на диск"""
+    os.lseek(fd, 0, os.SEEK_SET)
+    os.write(fd, f"{offset:0{_OFFSET_WIDTH}d}\n".encode('ascii'))
+    os.fsync(fd)
+
+
+def create_pad(path, size, stream=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Создаёт файл-блокнот из size случайных байт и пустой журнал
+    stream - источник байт (KeyStream), по умолчанию криптостойкий
+    Существующий блокнот не перезаписывается (FileExistsError).
+    """
+    if size <= 0:
+        raise ValueError("Размер блокнота должен быть положительным")
+    stream = stream or SECURE
+    with open(path, 'xb') as pad:
+        for start in range(0, size, chunk_size):
+            pad.write(stream.random_bytes(min(chunk_size, size - start)))
+        pad.flush()
+        os.fsync(pad.fileno())
+
+    fd = os.open(path + JOURNAL_SUFFIX, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        _write_offset(fd, 0)
+    finally:
+        os.close(fd)
+
+
+class OneTimePad:
+    """
+    Файл-блокнот, из которого ключи выдаются без повторов
+
+    path - путь к блокноту, journal - путь к существующему журналу
+    (по умолчанию path + ".offset", его создаёт create_pad)
+    """
+
+    def __init__(self, path, journal=None):
+        self.path = path
+        self.journal_path = journal or path + JOURNAL_SUFFIX
+        self._file = open(path, 'rb')
+        try:
+            self.size = os.fstat(self._file.fileno()).st_size
+            if self.size == 0:
+                raise ValueError(f"Блокнот пуст: {path}")
+            # Журнал не создаётся заново: без него блокнот выдавался бы с начала
+            self._journal = os.open(self.journal_path, os.O_RDWR)
+        except BaseException:
+            self._file.close()
+            raise
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        # flock не разделяет потоки одного процесса, поэтому нужна ещё и обычная блокировка
+        self._thread_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Закрывает блокнот; выданные куски ключа должны быть уже освобождены
+        Если какой-то кусок ещё жив, блокнот остаётся открытым (BufferError).
+        """
+        if self._file.closed:
+            return
+        self._view.release()
+        try:
+            self._map.close()
+        except BufferError:
+            self._view = memoryview(self._map)
+            raise BufferError("Нельзя закрыть блокнот: выданные куски ключа ещё не освобождены") from None
+        try:
+            os.close(self._journal)
+        finally:
+            self._file.close()
+
+    def consumed(self):
+        """Число уже выданных байт блокнота"""
+        with self._thread_lock:
+            _lock(self._journal)
+            try:
+                return _read_offset(self._journal)
+            finally:
+                _unlock(self._journal)
+
+    def remaining(self):
+        """Число ещё не выданных байт блокнота"""
+        return self.size - self.consumed()
+
+    def reserve(self, count):
+        """
+        Резервирует count байт блокнота и возвращает смещение куска
+        Новое смещение записывается в журнал до возврата.
+        """
+        if count < 0:
+            raise ValueError("Длина ключа не может быть отрицательной")
+        with self._thread_lock:
+            _lock(self._journal)
+            try:
+                offset = _read_offset(self._journal)
+                if offset + count > self.size:
+                    raise ValueError(
+                        f"В блокноте осталось {self.size - offset} байт, а нужно {count}"
+                    )
+                _write_offset(self._journal, offset + count)
+            finally:
+                _unlock(self._journal)
+        return offset
+
+    def key(self, offset, count):
+        """Кусок ключа [offset, offset + count) без копирования (memoryview)"""
+        if offset < 0 or count < 0 or offset + count > self.size:
+            raise ValueError(f"Кусок [{offset}, {offset + count}) выходит за пределы блокнота ({self.size} байт)")
+        return self._view[offset:offset + count]
+
+    def take(self, count):
+        """Резервирует и возвращает новый кусок ключа: (смещение, memoryview)"""
+        offset = self.reserve(count)
+        return offset, self.key(offset, count)
+
+    def encrypt(self, text):
+        """
+        Шифрует текст (буквы алфавита) новым куском блокнота
+        Возвращает (смещение ключа, шифртекст); смещение нужно для расшифрования.
+        """
+        offset, key = self.take(len(text))
+        with key:
+            return offset, encrypt_otp_fast(text, key)
+
+    def decrypt(self, cipher, offset):
+        """Расшифровывает текст куском блокнота, начинающимся со смещения offset"""
+        with self.key(offset, len(cipher)) as key:
+            return decrypt_otp_fast(cipher, key)
+
+    def encrypt_bytes(self, data):
+        """Побайтовый шифр Вернама новым куском блокнота: (смещение, bytearray)"""
+        offset, key = self.take(len(data))
+        with key:
+            return offset, vernam_xor(data, key)
+
+    def decrypt_bytes(self, data, offset):
+        """Расшифровывает байты куском блокнота, начинающимся со смещения offset"""
+        with self.key(offset, len(data)) as key:
+            return vernam_xor(data, key)
@@ -0,0 +1,357 @@
+"""
+Поиск повторного использования ключа гаммирования (two-time pad)
+
+Если два сообщения зашифрованы одним ключом, то разность шифртекстов
+(C1 - C2) mod 32 = (P1 - P2) mod 32 не зависит от ключа. Для двух
+осмысленных текстов её буквы распределены неравномерно (например, 0
+встречается чаще, чем 1/32), и индекс совпадений разности заметно
+выше 1/32, а для разных ключей он равен 1/32 с точностью до шума.
+Индекс совпадений однозначно связан со статистикой хи-квадрат
+χ² = 32 (IC (N - 1) + 1) - N, которая для равномерной разности длины N
+распределена как χ² с 31 степенью свободы. Значимость пары - вероятность
+P(χ² ≥ x) (chi2_tail), а порог для пары делится на число проверенных пар
+(поправка Бонферрони), так что вероятность хотя бы одной ложной пары во
+всём наборе не больше alpha.
+
+Проверять все пары сообщений долго, поэтому сначала строится индекс
+по n-граммам на одинаковых позициях: при общем ключе совпадение
+n-граммы шифртекста на позиции i означает совпадение n-граммы открытого
+текста, что для языка в десятки раз вероятнее, чем для случайных букв
+(для триграмм примерно в 50 раз). Кандидатами становятся только пары,
+попавшие хотя бы в min_shared общих корзин индекса, и только они
+проверяются по индексу совпадений. Индекс строится блоками позиций
+на нескольких процессах.
+
+Для найденной пары crib_drag перебирает положения известного слова
+(«шпаргалки») в одном сообщении и показывает соответствующий кусок
+другого сообщения; куски упорядочиваются по средней log10 вероятности
+биграмм (build_bigram_table).
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .otp import normalize_text
+from .otp_numpy import indices_to_text, text_to_indices
+
+SIZE = 32
+
+# Код n-граммы (число по основанию 32) должен помещаться в int64: 32 ** 12 = 2 ** 60
+MAX_GRAM = 12
+
+# Минимальная общая длина пары: при равномерной разности каждое из 32 значений
+# ожидается не меньше 5 раз, иначе приближение хи-квадрат неточно
+MIN_OVERLAP = 5 * SIZE
+
+# Заполнитель позиций за концом сообщения в упакованной матрице
+_PADDING = 255
+
+# Состояние процесса-исполнителя, заполняется в _init_worker
+_worker_matrix = None
+_worker_lengths = None
+
+
+def to_indices(cipher):
+    """Шифртекст (строка или массив индексов) в массив индексов uint8"""
+    if isinstance(cipher, str):
+        return text_to_indices(normalize_text(cipher))
+    return np.asarray(cipher, dtype=np.uint8)
+
+
+def build_bigram_table(chunks, floor=0.01):
+    """
+    Строит таблицу log10 вероятностей биграмм по обучающему тексту
+    chunks - строка или последовательность частей текста
+    floor - условное число появлений для биграмм, не встреченных в тексте
+
+    Возвращает массив длины 32 * 32, индекс биграммы ab - a * 32 + b.
+    """
+    if isinstance(chunks, str):
+        chunks = [chunks]
+
+    counts = np.zeros(SIZE * SIZE, dtype=np.int64)
+    previous = None
+    for chunk in chunks:
+        indices = text_to_indices(normalize_text(chunk)).astype(np.int64)
+        if previous is not None and len(indices):
+            counts[previous * SIZE + indices[0]] += 1
+        counts += np.bincount(indices[:-1] * SIZE + indices[1:], minlength=SIZE * SIZE)
+        if len(indices):
+            previous = indices[-1]
+
+    total = counts.sum()
+    if total == 0:
+        raise ValueError("Обучающий текст должен содержать не меньше 2 букв")
+    return np.log10(np.maximum(counts, floor) / total)
+
+
+def difference(c1, c2):
+    """(c1 - c2) mod 32 по общей длине двух шифртекстов"""
+    c1, c2 = to_indices(c1), to_indices(c2)
+    length = min(len(c1), len(c2))
+    return (c1[:length] - c2[:length]) & 31
+
+
+def index_of_coincidence(values):
+    """Индекс совпадений последовательности значений 0..31"""
+    length = len(values)
+    if length < 2:
+        return 0.0
+    counts = np.bincount(values, minlength=SIZE).astype(np.int64)
+    return float((counts * (counts - 1)).sum()) / (length * (length - 1))
+
+
+def coincidence_chi2(ic, length):
+    """Статистика хи-квадрат (31 степень свободы) по индексу совпадений разности длины length"""
+    return SIZE * (ic * (length - 1) + 1) - length
+
+
+def chi2_tail(x, dof=SIZE - 1):
+    """
+    P(χ² ≥ x) для нечётного числа степеней свободы dof:
+    erfc(√y) + e^(-y) · Σ y^(j - 1/2) / Γ(j + 1/2), j = 1..(dof - 1)/2, y = x/2
+    """
+    if dof % 2 != 1:
+        raise ValueError("Число степеней свободы должно быть нечётным")
+    if x <= 0:
+        return 1.0
+    y = x / 2
+    total = math.erfc(math.sqrt(y))
+    log_term = 0.5 * math.log(y) - math.lgamma(1.5)
+    for j in range(1, (dof + 1) // 2):
+        total += math.exp(log_term - y)
+        log_term += math.log(y) - math.log(j + 0.5)
+    return min(total, 1.0)
+
+
+def chi2_threshold(level, dof=SIZE - 1):
+    """Наименьшее x, при котором P(χ² ≥ x) <= level (делением отрезка пополам)"""
+    if not 0 < level < 1:
+        raise ValueError("Уровень значимости должен быть между 0 и 1")
+    low, high = 0.0, float(dof)
+    while chi2_tail(high, dof) > level:
+        low, high = high, high * 2
+    for _ in range(100):
+        middle = (low + high) / 2
+        if chi2_tail(middle, dof) > level:
+            low = middle
+        else:
+            high = middle
+    return high
+
+
+def reuse_score(c1, c2):
+    """
+    Оценка общего ключа для пары шифртекстов
+    Возвращает (индекс совпадений разности, P(χ² ≥ x) для равномерной разности).
+    """
+    diff = difference(c1, c2)
+    ic = index_of_coincidence(diff)
+    if len(diff) < 2:
+        return ic, 1.0
+    return ic, chi2_tail(coincidence_chi2(ic, len(diff)))
+
+
+def pack_ciphers(ciphers):
+    """
+    Упаковывает шифртексты в матрицу uint8 (сообщение x позиция),
+    позиции за концом сообщения заполняются значением 255
+    Возвращает (матрица, массив длин).
+    """
+    ciphers = [to_indices(cipher) for cipher in ciphers]
+    lengths = np.array([len(cipher) for cipher in ciphers], dtype=np.int64)
+    matrix = np.full((len(ciphers), int(lengths.max(initial=0))), _PADDING, dtype=np.uint8)
+    for row, cipher in enumerate(ciphers):
+        matrix[row, :len(cipher)] = cipher
+    return matrix, lengths
+
+
+def _block_pairs(matrix, start, stop, gram, max_bucket):
+    """
+    Пары сообщений с общими n-граммами на позициях start..stop-1
+    Возвращает (коды пар i * число сообщений + j при i < j, число общих n-грамм).
+    """
+    count = len(matrix)
+    columns = matrix[:, start:stop + gram - 1]
+    width = columns.shape[1] - gram + 1
+    if width <= 0 or count < 2:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    codes = np.zeros((count, width), dtype=np.int64)
+    valid = np.ones((count, width), dtype=bool)
+    for offset in range(gram):
+        part = columns[:, offset:offset + width]
+        codes = codes * SIZE + (part & 31)
+        valid &= part < SIZE
+
+    # Корзина - пара (позиция, код n-граммы); внутри корзины номера сообщений возрастают
+    positions = np.broadcast_to(np.arange(start, start + width, dtype=np.int64), valid.shape)[valid]
+    codes = codes[valid]
+    ids = np.broadcast_to(np.arange(count, dtype=np.int64)[:, np.newaxis], valid.shape)[valid]
+    order = np.lexsort((ids, codes, positions))
+    positions, codes, ids = positions[order], codes[order], ids[order]
+
+    # Слишком большие корзины (общие заголовки и т.п.) дают квадратичное число пар
+    first = np.concatenate(([True], (positions[1:] != positions[:-1]) | (codes[1:] != codes[:-1])))
+    group = np.cumsum(first) - 1
+    keep = np.bincount(group)[group] <= max_bucket
+    positions, codes, ids = positions[keep], codes[keep], ids[keep]
+
+    pairs = []
+    for distance in range(1, max_bucket):
+        same = (positions[:-distance] == positions[distance:]) & (codes[:-distance] == codes[distance:])
+        if not same.any():
+            break
+        pairs.append(ids[:-distance][same] * count + ids[distance:][same])
+    if not pairs:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.unique(np.concatenate(pairs), return_counts=True)
+
+
+def _verify_pairs(matrix, lengths, pairs, threshold, batch=4096):
+    """
+    Проверяет пары по индексу совпадений разности пачками: [(i, j, ic, p), ...]
+    threshold - порог статистики хи-квадрат. Разность считается по общей
+    длине пары; пары короче MIN_OVERLAP не проверяются.
+    """
+    pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+    found = []
+    for start in range(0, len(pairs), batch):
+        first, second = pairs[start:start + batch].T
+        length = np.minimum(lengths[first], lengths[second])
+        width = int(length.max(initial=0))
+        diff = (matrix[first, :width] - matrix[second, :width]) & 31
+        # За общей длиной пары - фиктивное значение 32, его счётчик отбрасывается
+        diff[np.arange(width) >= length[:, np.newaxis]] = SIZE
+        rows = np.arange(len(first))[:, np.newaxis] * (SIZE + 1)
+        counts = np.bincount((rows + diff).ravel(), minlength=len(first) * (SIZE + 1))
+        counts = counts.reshape(len(first), SIZE + 1)[:, :SIZE]
+        ic = (counts * (counts - 1)).sum(axis=1) / np.maximum(length * (length - 1), 1)
+        chi2 = SIZE * (ic * (length - 1) + 1) - length
+        for index in np.flatnonzero((chi2 >= threshold) & (length >= MIN_OVERLAP)):
+            found.append((int(first[index]), int(second[index]), float(ic[index]), chi2_tail(chi2[index])))
+    return found
+
+
+def _init_worker(matrix, lengths):
+    """Сохраняет упакованные шифртексты в процессе-исполнителе"""
+    global _worker_matrix, _worker_lengths
+    _worker_matrix = matrix
+    _worker_lengths = lengths
+
+
+def _index_task(task):
+    """Индекс для блока позиций; task = (начало, конец, n, размер корзины)"""
+    return _block_pairs(_worker_matrix, *task)
+
+
+def _verify_task(task):
+    """Проверка части кандидатов; task = (пары, порог хи-квадрат)"""
+    pairs, threshold = task
+    return _verify_pairs(_worker_matrix, _worker_lengths, pairs, threshold)
+
+
+def find_reused_keys(ciphertexts, gram=3, min_shared=1, alpha=0.01, block=256,
+                     max_bucket=64, exhaustive=False, workers=1):
+    """
+    Ищет пары шифртекстов, зашифрованных одним ключом (с одной позиции)
+
+    gram - длина n-грамм индекса кандидатов (1..MAX_GRAM); меньше n -
+           больше пар проверяется и меньше пропусков, больше n - наоборот
+    min_shared - сколько общих n-грамм нужно паре, чтобы её проверить
+    alpha - допустимая вероятность хотя бы одной ложной пары среди
+            проверенных: пара принимается, если P(χ² ≥ x) <= alpha / число
+            проверенных пар (поправка Бонферрони)
+    block - число позиций в одной задаче построения индекса
+    max_bucket - корзины индекса большего размера пропускаются
+    exhaustive - проверить все пары без индекса (для небольших наборов)
+    workers - число процессов (None - число ядер, 1 - без пула)
+
+    Возвращает список (i, j, индекс совпадений, P(χ² ≥ x)) по возрастанию
+    вероятности, где i < j - номера шифртекстов.
+    """
+    if not 1 <= gram <= MAX_GRAM:
+        raise ValueError(f"Длина n-граммы должна быть от 1 до {MAX_GRAM}")
+    matrix, lengths = pack_ciphers(ciphertexts)
+    count = len(matrix)
+    workers = workers or os.cpu_count() or 1
+
+    executor = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(matrix, lengths))
+    try:
+        if exhaustive:
+            first, second = np.triu_indices(count, k=1)
+            candidates = np.stack([first, second], axis=1)
+        else:
+            tasks = [(start, start + block, gram, max_bucket) for start in range(0, matrix.shape[1], block)]
+            if executor is None:
+                results = [_block_pairs(matrix, *task) for task in tasks]
+            else:
+                results = list(executor.map(_index_task, tasks))
+            codes = np.concatenate([codes for codes, _ in results] + [np.empty(0, dtype=np.int64)])
+            shared = np.concatenate([shared for _, shared in results] + [np.empty(0, dtype=np.int64)])
+            codes, inverse = np.unique(codes, return_inverse=True)
+            totals = np.bincount(inverse, weights=shared, minlength=len(codes))
+            codes = codes[totals >= min_shared]
+            candidates = np.stack([codes // count, codes % count], axis=1)
+
+        threshold = chi2_threshold(alpha / max(len(candidates), 1))
+        if executor is None:
+            found = _verify_pairs(matrix, lengths, candidates, threshold)
+        else:
+            chunks = np.array_split(candidates, workers * 4)
+            found = [pair for part in executor.map(_verify_task, [(chunk, threshold) for chunk in chunks])
+                     for pair in part]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    found.sort(key=lambda pair: pair[3])
+    return found
+
+
+def crib_drag(c1, c2, crib, scores=None, limit=None):
+    """
+    Перетаскивание шпаргалки по паре шифртекстов с общим ключом
+
+    crib - предполагаемое слово открытого текста
+    scores - таблица build_bigram_table; без неё результаты идут по позициям
+    limit - сколько лучших вариантов вернуть (None - все)
+
+    Для каждой позиции шпаргалка ставится в первое сообщение (тогда
+    кусок второго P2 = P1 - D) и во второе (P1 = P2 + D).
+    Возвращает список (оценка, позиция, номер сообщения со шпаргалкой,
+    кусок другого сообщения); оценка - средний log10 вероятности биграмм
+    куска или None без таблицы и для шпаргалки из одной буквы (тогда
+    результаты идут по позициям).
+    """
+    diff = difference(c1, c2)
+    crib = text_to_indices(normalize_text(crib))
+    if not len(crib) or len(crib) > len(diff):
+        return []
+    windows = np.lib.stride_tricks.sliding_window_view(diff, len(crib))
+    placements = [
+        (1, (crib - windows) & 31),
+        (2, (crib + windows) & 31),
+    ]
+
+    # Оценка по биграммам возможна только для шпаргалки хотя бы из двух букв
+    table = None if scores is None or len(crib) < 2 else np.asarray(scores, dtype=np.float64)
+    results = []
+    for message, fragments in placements:
+        if table is None:
+            values = [None] * len(fragments)
+        else:
+            pair_codes = fragments[:, :-1].astype(np.int64) * SIZE + fragments[:, 1:]
+            values = table[pair_codes].mean(axis=1).tolist()
+        for position, (value, fragment) in enumerate(zip(values, fragments)):
+            results.append((value, position, message, indices_to_text(fragment)))
+
+    if table is None:
+        results.sort(key=lambda result: (result[1], result[2]))
+    else:
+        results.sort(key=lambda result: result[0], reverse=True)
+    return results if limit is None else results[:limit]
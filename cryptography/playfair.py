@@ -0,0 +1,250 @@
+"""
+Шифр Плейфера 5x6 для русского алфавита
+"""
+from functools import lru_cache
+
+ALPHABET = "АБВГДЕЖЗИКЛМНОПРСТУФХЦЧШЩЫЬЭЮЯ"
+
+# Сколько скомпилированных ключей хранится в кэше
+KEY_CACHE_SIZE = 128
+
+# Размер части при потоковой обработке файла (в символах)
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def check_keyword_duplicates(keyword):
+    """
+    Проверяет ключевое слово на наличие повторяющихся символов
+    после выполнения всех замен (Ё->Е, Й->И, Ь->Ъ).
+    """
+    # Нормализуем ключ так же, как это делает основная программа
+    clean_key = keyword.upper().replace("Ё", "Е").replace("Й", "И").replace("Ь", "Ъ")
+    # Убираем все символы, не входящие в рабочий алфавит (пробелы и т.д.)
+    alphabet = "АБВГДЕЖЗИКЛМНОПРСТУФХЦЧШЩЫЬЭЮЯ"
+    clean_key = "".join([c for c in clean_key if c in alphabet])
+    
+    seen = set()
+    duplicates = []
+    for char in clean_key:
+        if char in seen:
+            if char not in duplicates:
+                duplicates.append(char)
+        else:
+            seen.add(char)
+    
+    return duplicates
+
+def create_playfair_matrix(keyword):
+    """Создает матрицу 5x6 на основе ключевого слова."""
+    alphabet = "АБВГДЕЖЗИКЛМНОПРСТУФХЦЧШЩЫЬЭЮЯ"
+    keyword = keyword.upper().replace("Ё", "Е").replace("Й", "И").replace("Ь", "Ъ")
+    
+    matrix_string = ""
+    for char in keyword:
+        if char in alphabet and char not in matrix_string:
+            matrix_string += char
+            
+    for char in alphabet:
+        if char not in matrix_string:
+            matrix_string += char
+            
+    return [list(matrix_string[i:i+6]) for i in range(0, 30, 6)]
+
+def normalize_chunk(text):
+    """Переводит в верхний регистр, делает замены и удаляет символы вне алфавита."""
+    text = text.upper().replace("Ё", "Е").replace("Й", "И").replace("Ь", "Ъ")
+    return ''.join([c for c in text if c in ALPHABET])
+
+def prepare_stream(chunks):
+    """
+    Потоковый вариант prepare_text: принимает части текста и выдаёт
+    подготовленный текст частями чётной длины (целыми биграммами).
+    Между частями переносится только одна незакрытая буква биграммы,
+    поэтому результат совпадает с prepare_text для всего текста,
+    а расход памяти не зависит от его длины.
+    """
+    pending = None
+    for chunk in chunks:
+        bigrams = []
+        for char in normalize_chunk(chunk):
+            if pending is None:
+                pending = char
+            elif pending == char:
+                # Повтор буквы в биграмме: вставляем Х (или Ь после Х),
+                # а повторная буква начинает следующую биграмму
+                bigrams.append(pending + ('Ь' if pending == 'Х' else 'Х'))
+            else:
+                bigrams.append(pending + char)
+                pending = None
+        if bigrams:
+            yield ''.join(bigrams)
+    if pending is not None:
+        yield pending + 'Х'
+
+def prepare_text(text):
+    """Подготавливает текст: удаляет мусор, делает замены, разбивает на биграммы."""
+    return ''.join(prepare_stream([text]))
+
+def get_coordinates(matrix, char):
+    """Находит строку и столбец буквы в матрице."""
+    for row in range(5):
+        for col in range(6):
+            if matrix[row][col] == char:
+                return row, col
+    return None, None
+
+class PlayfairKey:
+    """
+    Скомпилированный ключ Плейфера: матрица 5x6, словарь
+    буква -> (строка, столбец) и, при bigram_tables=True, готовые
+    таблицы замен всех 900 биграмм для шифрования и расшифрования
+    """
+
+    def __init__(self, keyword, bigram_tables=True):
+        self._compile(create_playfair_matrix(keyword), bigram_tables)
+
+    @classmethod
+    def from_matrix(cls, matrix, bigram_tables=True):
+        """Ключ по готовой матрице 5x6 (например, найденной атакой)"""
+        key = cls.__new__(cls)
+        key._compile([list(row) for row in matrix], bigram_tables)
+        return key
+
+    def _compile(self, matrix, bigram_tables):
+        self.matrix = matrix
+        self.coordinates = {
+            char: (row, col)
+            for row, line in enumerate(self.matrix)
+            for col, char in enumerate(line)
+        }
+        self.encrypt_table = None
+        self.decrypt_table = None
+        if bigram_tables:
+            self.encrypt_table = {a + b: self.encrypt_bigram(a, b) for a in ALPHABET for b in ALPHABET}
+            self.decrypt_table = {a + b: self.decrypt_bigram(a, b) for a in ALPHABET for b in ALPHABET}
+
+    def _substitute(self, char1, char2, shift):
+        """Замена биграммы: shift=1 при шифровании, shift=-1 при расшифровании"""
+        matrix = self.matrix
+        r1, c1 = self.coordinates[char1]
+        r2, c2 = self.coordinates[char2]
+        if r1 == r2:
+            return matrix[r1][(c1 + shift) % 6] + matrix[r2][(c2 + shift) % 6]
+        if c1 == c2:
+            return matrix[(r1 + shift) % 5][c1] + matrix[(r2 + shift) % 5][c2]
+        return matrix[r1][c2] + matrix[r2][c1]
+
+    def encrypt_bigram(self, char1, char2):
+        """Шифрует одну биграмму"""
+        return self._substitute(char1, char2, 1)
+
+    def decrypt_bigram(self, char1, char2):
+        """Расшифровывает одну биграмму"""
+        return self._substitute(char1, char2, -1)
+
+    def encrypt(self, prepared_text):
+        """Шифрует подготовленный текст (результат prepare_text)"""
+        if self.encrypt_table is not None:
+            table = self.encrypt_table
+            return "".join([table[prepared_text[i:i+2]] for i in range(0, len(prepared_text), 2)])
+        return "".join([self.encrypt_bigram(prepared_text[i], prepared_text[i+1])
+                        for i in range(0, len(prepared_text), 2)])
+
+    def decrypt(self, ciphertext):
+        """Расшифровывает текст, состоящий из биграмм"""
+        if self.decrypt_table is not None:
+            table = self.decrypt_table
+            return "".join([table[ciphertext[i:i+2]] for i in range(0, len(ciphertext), 2)])
+        return "".join([self.decrypt_bigram(ciphertext[i], ciphertext[i+1])
+                        for i in range(0, len(ciphertext), 2)])
+
+def normalize_keyword(keyword):
+    """
+    Приводит ключевое слово к виду, в котором оно попадает в матрицу:
+    замены Ё->Е, Й->И, Ь->Ъ, только буквы алфавита, без повторов.
+    Ключи, дающие одну и ту же матрицу, нормализуются одинаково.
+    """
+    keyword = keyword.upper().replace("Ё", "Е").replace("Й", "И").replace("Ь", "Ъ")
+    return "".join(dict.fromkeys(c for c in keyword if c in ALPHABET))
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def _compiled_key(normalized_keyword, bigram_tables):
+    return PlayfairKey(normalized_keyword, bigram_tables)
+
+def get_playfair_key(keyword, bigram_tables=True):
+    """
+    Возвращает скомпилированный ключ Плейфера из кэша
+    (последние KEY_CACHE_SIZE ключей, вытеснение по LRU)
+    """
+    return _compiled_key(normalize_keyword(keyword), bigram_tables)
+
+def print_encrypt_trace(matrix, prepared_text):
+    """Выводит матрицу 5x6 и текст, разбитый на биграммы."""
+    print("Сгенерированная матрица (5x6):")
+    print("\n" + "=" * 30)
+    for row in matrix:
+        print(" ".join(row))
+    print("=" * 30)
+    print(f"Текст, разбитый на биграммы: {prepared_text}")
+
+def playfair_encrypt(text, keyword, trace=None):
+    """
+    Основная функция шифрования Плейфера.
+    trace - необязательная функция trace(matrix, prepared_text)
+            для вывода матрицы и биграмм (например, print_encrypt_trace)
+    """
+    key = get_playfair_key(keyword)
+    prepared_text = prepare_text(text)
+    
+    if trace is not None:
+        trace(key.matrix, prepared_text)
+    
+    return key.encrypt(prepared_text)
+
+def playfair_decrypt(ciphertext, keyword):
+    """
+    Функция для расшифрования текста Плейфера.
+    Текст уже должен состоять из биграмм.
+    """
+    return get_playfair_key(keyword).decrypt(ciphertext)
+
+def playfair_encrypt_stream(chunks, keyword):
+    """
+    Шифрует Плейфером последовательность частей текста и выдаёт
+    шифртекст по частям; результат совпадает с playfair_encrypt
+    """
+    key = get_playfair_key(keyword)
+    for prepared_text in prepare_stream(chunks):
+        yield key.encrypt(prepared_text)
+
+def playfair_decrypt_stream(chunks, keyword):
+    """
+    Расшифровывает Плейфером последовательность частей шифртекста.
+    Символы вне алфавита (переводы строк, пробелы) пропускаются,
+    неполная биграмма переносится в следующую часть.
+    """
+    key = get_playfair_key(keyword)
+    tail = ''
+    for chunk in chunks:
+        text = tail + ''.join([c for c in chunk if c in ALPHABET])
+        even = len(text) - len(text) % 2
+        tail = text[even:]
+        if even:
+            yield key.decrypt(text[:even])
+    if tail:
+        raise ValueError("Шифртекст Плейфера должен состоять из целых биграмм")
+
+def _crypt_file(stream, src_path, dst_path, keyword, encoding, chunk_size):
+    """Читает src_path частями по chunk_size символов и пишет результат stream в dst_path"""
+    with open(src_path, encoding=encoding, newline='') as src, \
+            open(dst_path, 'w', encoding=encoding, newline='') as dst:
+        for part in stream(iter(lambda: src.read(chunk_size), ''), keyword):
+            dst.write(part)
+
+def playfair_encrypt_file(src_path, dst_path, keyword, encoding='utf-8', chunk_size=DEFAULT_CHUNK_SIZE):
+    """Шифрует Плейфером текстовый файл частями, не загружая его целиком"""
+    _crypt_file(playfair_encrypt_stream, src_path, dst_path, keyword, encoding, chunk_size)
+
+def playfair_decrypt_file(src_path, dst_path, keyword, encoding='utf-8', chunk_size=DEFAULT_CHUNK_SIZE):
+    """Расшифровывает Плейфером текстовый файл частями, не загружая его целиком"""
+    _crypt_file(playfair_decrypt_stream, src_path, dst_path, keyword, encoding, chunk_size)
@@ -0,0 +1,274 @@
+"""
+Атака на шифр Плейфера 5x6 по одному шифртексту
+
+Ключ ищется имитацией отжига: ключ - перестановка 30 букв алфавита
+по клеткам матрицы, на каждом шаге он немного меняется (обмен двух букв,
+строк, столбцов, отражение матрицы), а кандидат оценивается суммой
+логарифмов вероятностей квадграмм расшифрованного текста. Худший кандидат
+принимается с вероятностью exp(delta / T), температура T постепенно
+снижается; при T = 0 это обычный подъём к локальному максимуму.
+
+Расшифрование Плейфера в координатах не зависит от ключа: позиции двух
+букв шифртекста в матрице однозначно задают позиции букв открытого текста.
+Поэтому внутренний цикл работает только с индексами: позиция буквы ->
+готовая таблица на 900 пар позиций -> буква ключа -> таблица квадграмм
+(плоский array на 30^4 значений). Независимые перезапуски отжига
+выполняются на нескольких процессах.
+"""
+import math
+import os
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from .playfair import ALPHABET, normalize_chunk
+
+ROWS = 5
+COLS = 6
+SIZE = ROWS * COLS
+QUADGRAM_COUNT = SIZE ** 4
+
+_INDEX = {char: index for index, char in enumerate(ALPHABET)}
+
+# Состояние процесса-исполнителя, заполняется в _init_worker
+_worker_quadgrams = None
+_worker_cipher = None
+
+
+def _build_decrypt_pairs():
+    """
+    Для каждой пары позиций букв шифртекста (индекс 30 * p1 + p2)
+    возвращает пару позиций букв открытого текста
+    """
+    pairs = []
+    for p1 in range(SIZE):
+        r1, c1 = divmod(p1, COLS)
+        for p2 in range(SIZE):
+            r2, c2 = divmod(p2, COLS)
+            if r1 == r2:
+                pairs.append((r1 * COLS + (c1 - 1) % COLS, r2 * COLS + (c2 - 1) % COLS))
+            elif c1 == c2:
+                pairs.append((((r1 - 1) % ROWS) * COLS + c1, ((r2 - 1) % ROWS) * COLS + c2))
+            else:
+                pairs.append((r1 * COLS + c2, r2 * COLS + c1))
+    return pairs
+
+
+DECRYPT_PAIRS = _build_decrypt_pairs()
+
+
+def text_to_indices(text):
+    """Нормализует текст как prepare_text и переводит буквы в индексы 0..29"""
+    return array('B', [_INDEX[char] for char in normalize_chunk(text)])
+
+
+def cipher_to_indices(ciphertext):
+    """
+    Переводит буквы шифртекста в индексы 0..29 без замен
+    (в шифртексте может быть Ь), прочие символы пропускаются
+    """
+    return array('B', [_INDEX[char] for char in ciphertext.upper() if char in _INDEX])
+
+
+def build_quadgram_table(chunks, floor=0.01):
+    """
+    Строит таблицу log10 вероятностей квадграмм по обучающему тексту
+    chunks - строка или последовательность частей текста (файл и т.п.)
+    floor - условное число появлений для квадграмм, не встреченных в тексте
+
+    Возвращает array('d') длины 30^4, индекс квадграммы abcd -
+    ((a * 30 + b) * 30 + c) * 30 + d.
+    """
+    if isinstance(chunks, str):
+        chunks = [chunks]
+
+    counts = array('I', bytes(4 * QUADGRAM_COUNT))
+    quadgram = 0
+    letters = 0
+    for chunk in chunks:
+        for index in text_to_indices(chunk):
+            quadgram = (quadgram * SIZE + index) % QUADGRAM_COUNT
+            letters += 1
+            if letters >= 4:
+                counts[quadgram] += 1
+
+    total = letters - 3
+    if total <= 0:
+        raise ValueError("Обучающий текст должен содержать не меньше 4 букв")
+
+    log_total = math.log10(total)
+    floor_value = math.log10(floor) - log_total
+    return array('d', [math.log10(count) - log_total if count else floor_value for count in counts])
+
+
+def score_indices(indices, quadgrams):
+    """Сумма log10 вероятностей всех квадграмм текста (чем больше, тем лучше)"""
+    return math.fsum(map(quadgrams.__getitem__, [
+        ((a * SIZE + b) * SIZE + c) * SIZE + d
+        for a, b, c, d in zip(indices, indices[1:], indices[2:], indices[3:])
+    ]))
+
+
+def decrypt_indices(cipher, key):
+    """
+    Расшифровывает индексы шифртекста ключом-перестановкой
+    key[p] - индекс буквы в клетке p матрицы (p = строка * 6 + столбец)
+    """
+    position = [0] * SIZE
+    for cell, letter in enumerate(key):
+        position[letter] = cell
+    return [
+        key[cell]
+        for first, second in zip(cipher[::2], cipher[1::2])
+        for cell in DECRYPT_PAIRS[position[first] * SIZE + position[second]]
+    ]
+
+
+# Квадграмма, начинающаяся со второй буквы биграммы a, продолжается
+# биграммой b и первой буквой биграммы c: индекс _HIGH[a] + 30 * b + _LOW[c]
+_PAIR_HIGH = [(code % SIZE) * SIZE ** 3 for code in range(SIZE * SIZE)]
+_PAIR_LOW = [code // SIZE for code in range(SIZE * SIZE)]
+
+
+def _decrypt_pair_codes(pairs, key):
+    """
+    Быстрый вариант decrypt_indices для внутреннего цикла отжига:
+    pairs - список пар индексов шифртекста, результат - коды биграмм
+    открытого текста 30 * a + b
+    """
+    position = [0] * SIZE
+    for cell, letter in enumerate(key):
+        position[letter] = cell
+    codes = []
+    append = codes.append
+    for first, second in pairs:
+        cell1, cell2 = DECRYPT_PAIRS[position[first] * SIZE + position[second]]
+        append(key[cell1] * SIZE + key[cell2])
+    return codes
+
+
+def _score_pair_codes(codes, quadgrams):
+    """score_indices по кодам биграмм: квадграммы с чётных и нечётных позиций"""
+    return (
+        sum([quadgrams[a * SIZE * SIZE + b] for a, b in zip(codes, codes[1:])])
+        + sum([quadgrams[_PAIR_HIGH[a] + b * SIZE + _PAIR_LOW[c]]
+               for a, b, c in zip(codes, codes[1:], codes[2:])])
+    )
+
+
+def key_to_matrix(key):
+    """Переводит ключ-перестановку в матрицу 5x6 из букв"""
+    return [[ALPHABET[key[row * COLS + col]] for col in range(COLS)] for row in range(ROWS)]
+
+
+def _mutate(key, rng):
+    """Случайное небольшое изменение ключа (возвращает новый список)"""
+    key = key[:]
+    choice = rng.random()
+    if choice < 0.9:
+        i, j = rng.sample(range(SIZE), 2)
+        key[i], key[j] = key[j], key[i]
+    elif choice < 0.94:
+        i, j = rng.sample(range(ROWS), 2)
+        key[i * COLS:(i + 1) * COLS], key[j * COLS:(j + 1) * COLS] = \
+            key[j * COLS:(j + 1) * COLS], key[i * COLS:(i + 1) * COLS]
+    elif choice < 0.98:
+        i, j = rng.sample(range(COLS), 2)
+        for row in range(0, SIZE, COLS):
+            key[row + i], key[row + j] = key[row + j], key[row + i]
+    elif choice < 0.99:
+        # Отражение строк сверху вниз
+        key = [cell for row in range(SIZE - COLS, -1, -COLS) for cell in key[row:row + COLS]]
+    else:
+        # Поворот матрицы на 180 градусов
+        key.reverse()
+    return key
+
+
+def default_temperature(length):
+    """Начальная температура в зависимости от длины шифртекста"""
+    return max(5.0, 10 + 0.087 * (length - 84))
+
+
+def anneal(cipher, quadgrams, seed=None, start_temperature=None, step=0.2, iterations=10000):
+    """
+    Один запуск имитации отжига из случайного ключа
+    cipher - индексы шифртекста (чётной длины)
+    iterations - число кандидатов на каждом значении температуры
+
+    Возвращает (оценка, ключ-перестановка) лучшего найденного ключа.
+    """
+    rng = random.Random(seed)
+    if start_temperature is None:
+        start_temperature = default_temperature(len(cipher))
+    if step <= 0:
+        raise ValueError("Шаг снижения температуры должен быть положительным")
+    temperatures = [start_temperature - i * step for i in range(max(1, math.ceil(start_temperature / step)))]
+
+    pairs = list(zip(cipher[::2], cipher[1::2]))
+    key = list(range(SIZE))
+    rng.shuffle(key)
+    score = _score_pair_codes(_decrypt_pair_codes(pairs, key), quadgrams)
+    best_key, best_score = key, score
+
+    for temperature in temperatures:
+        for _ in range(iterations):
+            candidate = _mutate(key, rng)
+            candidate_score = _score_pair_codes(_decrypt_pair_codes(pairs, candidate), quadgrams)
+            delta = candidate_score - score
+            if delta >= 0 or (temperature > 0 and rng.random() < math.exp(delta / temperature)):
+                key, score = candidate, candidate_score
+                if score > best_score:
+                    best_key, best_score = key, score
+
+    return best_score, best_key
+
+
+def _init_worker(quadgrams, cipher):
+    """Сохраняет таблицу квадграмм и шифртекст в процессе-исполнителе"""
+    global _worker_quadgrams, _worker_cipher
+    _worker_quadgrams = quadgrams
+    _worker_cipher = cipher
+
+
+def _anneal_task(task):
+    """Один перезапуск в процессе-исполнителе; task = (seed, параметры отжига)"""
+    seed, options = task
+    return anneal(_worker_cipher, _worker_quadgrams, seed, **options)
+
+
+def crack_playfair(ciphertext, quadgrams, restarts=4, workers=1, seed=None,
+                   start_temperature=None, step=0.2, iterations=10000):
+    """
+    Ищет ключ Плейфера по шифртексту
+
+    quadgrams - таблица build_quadgram_table
+    restarts - число независимых запусков отжига (побеждает лучший)
+    workers - число процессов (None - число ядер, 1 - без пула)
+    seed - начальное значение генератора для воспроизводимого поиска
+
+    Возвращает (матрица 5x6, открытый текст, оценка). Ключ определён
+    с точностью до эквивалентных матриц (циклические сдвиги строк
+    и столбцов дают тот же шифр).
+    """
+    cipher = cipher_to_indices(ciphertext)
+    if len(cipher) < 4 or len(cipher) % 2:
+        raise ValueError("Шифртекст должен состоять из целых биграмм (не меньше двух)")
+    if restarts < 1:
+        raise ValueError("Число перезапусков должно быть положительным")
+
+    base = random.Random(seed)
+    options = {"start_temperature": start_temperature, "step": step, "iterations": iterations}
+    tasks = [(base.getrandbits(64), options) for _ in range(restarts)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        results = [anneal(cipher, quadgrams, task_seed, **options) for task_seed, _ in tasks]
+    else:
+        with ProcessPoolExecutor(min(workers, restarts), initializer=_init_worker,
+                                 initargs=(quadgrams, cipher)) as executor:
+            results = list(executor.map(_anneal_task, tasks))
+
+    best_score, best_key = max(results, key=lambda result: result[0])
+    plaintext = "".join(ALPHABET[index] for index in decrypt_indices(cipher, best_key))
+    return key_to_matrix(best_key), plaintext, best_score
@@ -0,0 +1,426 @@
+"""
+Шифр вертикальной перестановки для русского алфавита
+
+Ключевое слово и длина текста полностью задают перестановку символов,
+поэтому она вычисляется один раз (compile_permutation) и хранится в кэше.
+Шифрование - чтение столбцов срезами text[col::num_cols] в порядке ключа,
+расшифрование - деление шифртекста на столбцы и чтение по строкам. Для очень
+длинных текстов те же перестановки применяются к массивам NumPy
+(permute_array, unpermute_array).
+
+Несколько проходов с разными ключевыми словами (multi_permutation_encrypt)
+сводятся к одной составной перестановке, поэтому N проходов стоят
+столько же, сколько один.
+"""
+import re
+from array import array
+from functools import lru_cache
+from itertools import zip_longest
+
+# Русский алфавит без Ё (32 буквы)
+ALPHABET = 'АБВГДЕЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ'
+
+# Всё, что не входит в алфавит (удаляется при очистке текста)
+_NON_ALPHABET = re.compile(f'[^{ALPHABET}]+')
+
+# Сколько скомпилированных перестановок хранится в кэше
+PERMUTATION_CACHE_SIZE = 256
+
+
+def clean_text(text):
+    """Очищает текст, оставляя только буквы русского алфавита"""
+    text = text.upper().replace('Ё', 'Е')
+    return _NON_ALPHABET.sub('', text)
+
+
+def generate_key_order(keyword):
+    """
+    Генерирует порядок столбцов на основе ключевого слова
+    
+    Например: КЛЮЧ -> [1, 3, 4, 2]
+    К=1, Л=3, Ю=4, Ч=2 (по алфавитному порядку)
+    """
+    # Очищаем ключевое слово
+    keyword = clean_text(keyword)
+    
+    # Создаем список кортежей (буква, исходная_позиция)
+    indexed_chars = [(char, i) for i, char in enumerate(keyword)]
+    
+    # Сортируем по буквам
+    sorted_chars = sorted(indexed_chars, key=lambda x: x[0])
+    
+    # Создаем массив порядка
+    order = [0] * len(keyword)
+    for rank, (char, original_pos) in enumerate(sorted_chars):
+        order[original_pos] = rank + 1
+    
+    return order
+
+
+def column_order(key_order):
+    """Индексы столбцов в порядке чтения (по возрастанию номеров в key_order)"""
+    return sorted(range(len(key_order)), key=key_order.__getitem__)
+
+
+def column_lengths(num_cols, length):
+    """Длины столбцов: первые length % num_cols столбцов на символ длиннее"""
+    num_rows, remainder = divmod(length, num_cols)
+    return [num_rows + 1 if i < remainder else num_rows for i in range(num_cols)]
+
+
+@lru_cache(maxsize=PERMUTATION_CACHE_SIZE)
+def _compiled_permutation(keyword, length):
+    num_cols = len(keyword)
+    permutation = array('I')
+    for col in column_order(generate_key_order(keyword)):
+        permutation.extend(range(col, length, num_cols))
+    return permutation
+
+
+def compile_permutation(keyword, length):
+    """
+    Перестановка вертикального шифра для текста длины length:
+    шифртекст[i] = текст[permutation[i]]
+
+    Возвращает array('I') из кэша по (ключевое слово, длина),
+    поэтому изменять результат нельзя.
+    """
+    keyword = clean_text(keyword)
+    if not keyword:
+        raise ValueError("Ключевое слово пустое")
+    return _compiled_permutation(keyword, length)
+
+
+def inverse_permutation(permutation):
+    """Обратная перестановка: текст[i] = шифртекст[inverse[i]]"""
+    inverse = array('I', bytes(permutation.itemsize * len(permutation)))
+    for position, source in enumerate(permutation):
+        inverse[source] = position
+    return inverse
+
+
+def compose_permutations(first, second):
+    """
+    Перестановка, равная применению first, а затем second:
+    result[i] = first[second[i]]
+    """
+    return array('I', [first[i] for i in second])
+
+
+@lru_cache(maxsize=PERMUTATION_CACHE_SIZE)
+def _compiled_multi_permutation(keywords, length):
+    permutation = _compiled_permutation(keywords[0], length)
+    for keyword in keywords[1:]:
+        permutation = compose_permutations(permutation, _compiled_permutation(keyword, length))
+    return permutation
+
+
+@lru_cache(maxsize=PERMUTATION_CACHE_SIZE)
+def _compiled_multi_inverse(keywords, length):
+    return inverse_permutation(_compiled_multi_permutation(keywords, length))
+
+
+def _clean_keywords(keywords):
+    """Очищает ключевые слова; пустой список или пустое слово - ошибка"""
+    keywords = tuple(clean_text(keyword) for keyword in keywords)
+    if not keywords or not all(keywords):
+        raise ValueError("Ключевое слово пустое")
+    return keywords
+
+
+def compile_multi_permutation(keywords, length):
+    """
+    Составная перестановка нескольких проходов вертикального шифра
+    keywords - ключевые слова в порядке шифрования
+
+    Возвращает array('I') из кэша по (ключевые слова, длина),
+    поэтому изменять результат нельзя.
+    """
+    return _compiled_multi_permutation(_clean_keywords(keywords), length)
+
+
+def _any_permutation(keyword, length):
+    """Перестановка для одного ключевого слова или списка ключевых слов"""
+    if isinstance(keyword, str):
+        return compile_permutation(keyword, length)
+    return compile_multi_permutation(keyword, length)
+
+
+def permute_array(values, keyword):
+    """
+    Вертикальная перестановка массива NumPy (коды символов, байты и т.п.)
+    одной операцией выборки по скомпилированной перестановке
+    keyword - ключевое слово или список ключевых слов (несколько проходов)
+    """
+    return values[_any_permutation(keyword, len(values))]
+
+
+def unpermute_array(values, keyword):
+    """Обратная к permute_array перестановка массива NumPy"""
+    result = values.copy()
+    result[_any_permutation(keyword, len(values))] = values
+    return result
+
+
+def _encrypt_columns(text, key_order):
+    """
+    Столбцы текста в порядке чтения: список (номер, индекс столбца, текст)
+    Каждый столбец - срез text[col::num_cols]
+    """
+    num_cols = len(key_order)
+    return [(key_order[col], col, text[col::num_cols]) for col in column_order(key_order)]
+
+
+def _decrypt_columns(encrypted_text, key_order):
+    """
+    Расшифровывает текст: делит его на столбцы и читает построчно
+    Возвращает (открытый текст, длины столбцов, столбцы (номер, индекс, текст))
+    """
+    num_cols = len(key_order)
+    col_lengths = column_lengths(num_cols, len(encrypted_text))
+
+    by_position = [''] * num_cols
+    columns = []
+    start = 0
+    for col in column_order(key_order):
+        column_text = encrypted_text[start:start + col_lengths[col]]
+        by_position[col] = column_text
+        columns.append((key_order[col], col, column_text))
+        start += col_lengths[col]
+
+    # Строки таблицы - кортежи из i-х символов столбцов
+    decrypted = ''.join(map(''.join, zip_longest(*by_position, fillvalue='')))
+    return decrypted, col_lengths, columns
+
+
+def decrypt_with_order(encrypted_text, key_order):
+    """
+    Расшифровывает очищенный текст по порядку столбцов
+    (как generate_key_order: номер по порядку для каждого столбца)
+    """
+    return _decrypt_columns(encrypted_text, key_order)[0]
+
+
+def _build_table(text, num_cols):
+    """Таблица построчной записи текста (пустые ячейки в неполной строке)"""
+    table = []
+    for start in range(0, len(text), num_cols):
+        row = list(text[start:start + num_cols])
+        table.append(row + [''] * (num_cols - len(row)))
+    return table
+
+
+def _print_table(keyword, table):
+    """Выводит таблицу перестановки с заголовком из букв ключа"""
+    num_cols = len(keyword)
+    
+    # Заголовок
+    header = "     "
+    for col in range(num_cols):
+        header += f"{keyword[col]:^5}"
+    print(header)
+    
+    header2 = "     "
+    for col in range(num_cols):
+        header2 += f"({col+1}){' '*2}"
+    print(header2)
+    
+    print("     " + "─" * (num_cols * 5))
+    
+    # Строки таблицы
+    for i, row in enumerate(table):
+        row_str = f"{i+1:3d} │ "
+        for cell in row:
+            if cell:
+                row_str += f"{cell:^5}"
+            else:
+                row_str += "  ·  "  # Пустая ячейка
+        print(row_str)
+
+
+def print_encrypt_trace(text, keyword, key_order, table, columns):
+    """
+    Выводит таблицу шифрования и прочитанные столбцы
+    columns - список (номер_по_порядку, индекс_столбца, текст_столбца)
+    """
+    num_cols = len(keyword)
+    num_rows = len(table)
+    remainder = len(text) % num_cols
+    
+    print(f"\nДлина текста: {len(text)} символов")
+    print(f"Количество столбцов: {num_cols}")
+    
+    if remainder != 0:
+        print(f"⚠ Последняя строка будет неполной: {remainder} символов из {num_cols}")
+    
+    print(f"Количество строк: {num_rows} (полных: {len(text) // num_cols}, неполных: {1 if remainder else 0})")
+    
+    # Выводим таблицу ДО перестановки
+    print("\n" + "=" * 80)
+    print("ТАБЛИЦА ШИФРОВАНИЯ (запись построчно)")
+    print("=" * 80)
+    print("\nКлючевое слово: " + keyword)
+    print("Порядок столбцов: " + str(key_order))
+    print("\nТаблица:")
+    _print_table(keyword, table)
+    print("=" * 80)
+    
+    print("\nПроцесс шифрования (чтение столбцов в порядке номеров):")
+    print("-" * 80)
+    for rank, col_index, column_text in columns:
+        if column_text:
+            print(f"Столбец №{rank} - '{keyword[col_index]}' (позиция {col_index+1}): {column_text}")
+        else:
+            print(f"Столбец №{rank} - '{keyword[col_index]}' (позиция {col_index+1}): [пусто]")
+    print("-" * 80)
+
+
+def print_decrypt_trace(encrypted_text, keyword, key_order, col_lengths, table, columns):
+    """
+    Выводит заполнение столбцов, таблицу расшифрования и прочитанные строки
+    columns - список (номер_по_порядку, индекс_столбца, текст_столбца)
+    """
+    num_cols = len(keyword)
+    num_rows = len(table)
+    remainder = len(encrypted_text) % num_cols
+    
+    print(f"\nДлина зашифрованного текста: {len(encrypted_text)} символов")
+    print(f"Количество столбцов: {num_cols}")
+    
+    if remainder != 0:
+        print(f"⚠ Последняя строка была неполной: {remainder} символов из {num_cols}")
+        print(f"  Количество пустых ячеек в последней строке: {num_cols - remainder}")
+    
+    print(f"Количество строк: {num_rows}")
+    
+    print("\n" + "=" * 80)
+    print("ТАБЛИЦА РАСШИФРОВАНИЯ")
+    print("=" * 80)
+    print("\nКлючевое слово: " + keyword)
+    print("Порядок столбцов: " + str(key_order))
+    print("\nПроцесс расшифрования (запись в столбцы по порядку номеров):")
+    print("-" * 80)
+    for rank, col_index, column_text in columns:
+        if column_text:
+            print(f"Столбец №{rank} - '{keyword[col_index]}' (позиция {col_index+1}): {column_text} (длина: {col_lengths[col_index]})")
+        else:
+            print(f"Столбец №{rank} - '{keyword[col_index]}' (позиция {col_index+1}): [пусто]")
+    print("-" * 80)
+    
+    # Выводим таблицу
+    print("\nТаблица:")
+    _print_table(keyword, table)
+    print("=" * 80)
+    
+    print("\nЧтение расшифрованного текста построчно:")
+    print("-" * 80)
+    for i, row in enumerate(table):
+        row_text = ''.join(cell for cell in row if cell)
+        if row_text:
+            print(f"Строка {i+1}: {row_text}")
+        else:
+            print(f"Строка {i+1}: [пусто]")
+    print("-" * 80)
+
+
+def vertical_permutation_encrypt(text, keyword, trace=None):
+    """
+    Шифрует текст методом вертикальной перестановки
+    
+    text - открытый текст
+    keyword - ключевое слово
+    trace - необязательная функция trace(text, keyword, key_order, table, columns)
+            для вывода хода шифрования (например, print_encrypt_trace)
+    """
+    # Очищаем текст
+    text = clean_text(text)
+    keyword = clean_text(keyword)
+    
+    if not keyword:
+        return "Ошибка: ключевое слово пустое!"
+    
+    if not text:
+        return "Ошибка: текст пустой!"
+    
+    # Читаем столбцы срезами в порядке ключа
+    key_order = generate_key_order(keyword)
+    columns = _encrypt_columns(text, key_order)
+    encrypted = ''.join(column_text for _, _, column_text in columns)
+    
+    if trace is not None:
+        # Таблица строится только для вывода
+        trace(text, keyword, key_order, _build_table(text, len(keyword)), columns)
+    
+    return encrypted
+
+
+def vertical_permutation_decrypt(encrypted_text, keyword, trace=None):
+    """
+    Расшифровывает текст методом вертикальной перестановки
+    
+    encrypted_text - зашифрованный текст
+    keyword - ключевое слово
+    trace - необязательная функция
+            trace(encrypted_text, keyword, key_order, col_lengths, table, columns)
+            для вывода хода расшифрования (например, print_decrypt_trace)
+    """
+    # Очищаем текст
+    encrypted_text = clean_text(encrypted_text)
+    keyword = clean_text(keyword)
+    
+    if not keyword:
+        return "Ошибка: ключевое слово пустое!"
+    
+    if not encrypted_text:
+        return "Ошибка: текст пустой!"
+    
+    # Записываем столбцы срезами в порядке ключа и читаем построчно
+    key_order = generate_key_order(keyword)
+    decrypted, col_lengths, columns = _decrypt_columns(encrypted_text, key_order)
+    
+    if trace is not None:
+        trace(encrypted_text, keyword, key_order, col_lengths,
+              _build_table(decrypted, len(keyword)), columns)
+    
+    return decrypted
+
+
+def multi_permutation_encrypt(text, keywords):
+    """
+    Шифрует текст несколькими проходами вертикальной перестановки
+    (первым ключевым словом, затем вторым и т.д.) за одну выборку
+    по составной перестановке
+
+    Результат совпадает с последовательными вызовами
+    vertical_permutation_encrypt для каждого ключевого слова.
+    """
+    text = clean_text(text)
+    try:
+        keywords = _clean_keywords(keywords)
+    except ValueError:
+        return "Ошибка: ключевое слово пустое!"
+
+    if not text:
+        return "Ошибка: текст пустой!"
+
+    permutation = _compiled_multi_permutation(keywords, len(text))
+    return ''.join([text[i] for i in permutation])
+
+
+def multi_permutation_decrypt(encrypted_text, keywords):
+    """
+    Расшифровывает текст, зашифрованный multi_permutation_encrypt
+    с теми же ключевыми словами (в том же порядке), по обратной
+    составной перестановке
+    """
+    encrypted_text = clean_text(encrypted_text)
+    try:
+        keywords = _clean_keywords(keywords)
+    except ValueError:
+        return "Ошибка: ключевое слово пустое!"
+
+    if not encrypted_text:
+        return "Ошибка: текст пустой!"
+
+    inverse = _compiled_multi_inverse(keywords, len(encrypted_text))
+    return ''.join([encrypted_text[i] for i in inverse])
@@ -0,0 +1,232 @@
+"""
+Восстановление ключа шифра вертикальной перестановки по шифртексту
+
+Для каждого возможного числа столбцов ищется порядок, в котором столбцы
+были прочитаны. Столбцы таблицы восстанавливаются слева направо: каждому
+назначается кусок шифртекста (номер столбца по порядку и начало куска).
+Длина куска известна по самому столбцу (первые len % num_cols столбцов
+на символ длиннее, как в vertical_permutation_decrypt), а начало куска
+с номером k лежит между k * num_rows и k * num_rows + k; варианты,
+не согласованные с уже назначенными номерами, отбрасываются.
+
+Каждый шаг оценивается по паре соседних столбцов: сумма величин
+log P(ab) - log P(a) - log P(b) по парам букв в одной строке. У правильных
+соседей она положительна, у случайных - около нуля или отрицательна.
+Из всех продолжений остаются beam_width лучших (лучевой поиск), так что
+ключ из 20 столбцов находится за секунды, а не перебором 20! вариантов.
+Разные числа столбцов проверяются на нескольких процессах.
+"""
+import heapq
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import zip_longest
+
+from .transposition import ALPHABET, clean_text, column_lengths, column_order, decrypt_with_order
+
+SIZE = len(ALPHABET)
+
+_INDEX = {char: index for index, char in enumerate(ALPHABET)}
+
+# Состояние процесса-исполнителя, заполняется в _init_worker
+_worker_cipher = None
+_worker_scores = None
+
+
+def text_to_indices(text):
+    """Очищает текст и переводит буквы в индексы 0..31"""
+    return [_INDEX[char] for char in clean_text(text)]
+
+
+def build_bigram_table(chunks, floor=0.01):
+    """
+    Строит таблицу log P(ab) - log P(a) - log P(b) (log10) по обучающему тексту
+    chunks - строка или последовательность частей текста
+    floor - условное число появлений для биграмм, не встреченных в тексте
+
+    Возвращает список длины 32 * 32, индекс биграммы ab - a * 32 + b.
+    """
+    if isinstance(chunks, str):
+        chunks = [chunks]
+
+    letter_counts = [0] * SIZE
+    bigram_counts = [0] * (SIZE * SIZE)
+    previous = None
+    for chunk in chunks:
+        for index in text_to_indices(chunk):
+            letter_counts[index] += 1
+            if previous is not None:
+                bigram_counts[previous * SIZE + index] += 1
+            previous = index
+
+    letters = sum(letter_counts)
+    if letters < 2:
+        raise ValueError("Обучающий текст должен содержать не меньше 2 букв")
+
+    letter_log = [math.log10(max(count, floor) / letters) for count in letter_counts]
+    bigram_total = letters - 1
+    return [
+        math.log10(max(bigram_counts[a * SIZE + b], floor) / bigram_total) - letter_log[a] - letter_log[b]
+        for a in range(SIZE)
+        for b in range(SIZE)
+    ]
+
+
+def score_text(indices, scores):
+    """Средняя оценка пары соседних букв текста (чем больше, тем лучше)"""
+    if len(indices) < 2:
+        return 0.0
+    return math.fsum(scores[a * SIZE + b] for a, b in zip(indices, indices[1:])) / (len(indices) - 1)
+
+
+def decrypt_indices(cipher, key_order):
+    """Расшифровывает индексы шифртекста по порядку столбцов (как decrypt_with_order)"""
+    num_cols = len(key_order)
+    lengths = column_lengths(num_cols, len(cipher))
+    by_position = [None] * num_cols
+    start = 0
+    for col in column_order(key_order):
+        by_position[col] = cipher[start:start + lengths[col]]
+        start += lengths[col]
+    return [index for row in zip_longest(*by_position) for index in row if index is not None]
+
+
+def _segment_starts(rank, num_rows, num_cols, long_count):
+    """
+    Возможные начала куска с номером rank в шифртексте: перед ним rank
+    кусков по num_rows букв и ещё столько букв, сколько среди них длинных
+    """
+    low = max(0, rank - (num_cols - long_count))
+    high = min(rank, long_count)
+    return range(rank * num_rows + low, rank * num_rows + high + 1)
+
+
+def _consistent(starts, longs, rank, start, is_long, num_rows):
+    """
+    Проверяет, что кусок (rank, start) согласуется с ближайшими уже
+    назначенными номерами: между номерами a < b разница начал равна
+    num_rows * (b - a) плюс число длинных кусков среди номеров a..b-1
+    """
+    before = rank - 1
+    while before >= 0 and starts[before] < 0:
+        before -= 1
+    if before >= 0:
+        extra = start - starts[before] - num_rows * (rank - before)
+        if not longs[before] <= extra <= longs[before] + rank - before - 1:
+            return False
+
+    after = rank + 1
+    while after < len(starts) and starts[after] < 0:
+        after += 1
+    if after < len(starts):
+        extra = starts[after] - start - num_rows * (after - rank)
+        if not is_long <= extra <= is_long + after - rank - 1:
+            return False
+    return True
+
+
+def search_width(cipher, num_cols, scores, beam_width=200, candidates=10):
+    """
+    Лучевой поиск порядка столбцов для заданного их числа
+    cipher - индексы шифртекста (text_to_indices)
+
+    Возвращает (средняя оценка текста, порядок столбцов) или None,
+    если столбцов больше, чем букв.
+    """
+    length = len(cipher)
+    if num_cols < 2 or num_cols > length:
+        return None
+    num_rows, long_count = divmod(length, num_cols)
+    segment_starts = [_segment_starts(rank, num_rows, num_cols, long_count) for rank in range(num_cols)]
+    cache = {}
+
+    def adjacency(left_start, left_length, right_start, right_length):
+        """Оценка пар букв соседних в таблице столбцов по их кускам"""
+        key = (left_start, left_length, right_start)
+        score = cache.get(key)
+        if score is None:
+            left_part = cipher[left_start:left_start + left_length]
+            right_part = cipher[right_start:right_start + right_length]
+            score = cache[key] = sum([scores[a * SIZE + b] for a, b in zip(left_part, right_part)])
+        return score
+
+    # Столбцы таблицы назначаются слева направо, каждому - кусок (номер, начало).
+    # Состояние: (оценка, номера столбцов, начала по номерам, длинные по номерам,
+    #             начало и длина куска последнего столбца)
+    beam = [(0.0, (), (-1,) * num_cols, (0,) * num_cols, 0, 0)]
+    for col in range(num_cols):
+        is_long = 1 if col < long_count else 0
+        col_length = num_rows + is_long
+        expanded = []
+        for score, ranks, starts, longs, last_start, last_length in beam:
+            for rank in range(num_cols):
+                if starts[rank] >= 0:
+                    continue
+                for start in segment_starts[rank]:
+                    if not _consistent(starts, longs, rank, start, is_long, num_rows):
+                        continue
+                    new_score = score
+                    if col:
+                        new_score += adjacency(last_start, last_length, start, col_length)
+                    expanded.append((
+                        new_score,
+                        ranks + (rank + 1,),
+                        starts[:rank] + (start,) + starts[rank + 1:],
+                        longs[:rank] + (is_long,) + longs[rank + 1:],
+                        start,
+                        col_length,
+                    ))
+        beam = heapq.nlargest(beam_width, expanded, key=lambda state: state[0])
+
+    # Лучшие кандидаты сравниваются по оценке всего расшифрованного текста
+    best = None
+    for _, key_order, _, _, _, _ in beam[:candidates]:
+        key_order = list(key_order)
+        result = (score_text(decrypt_indices(cipher, key_order), scores), key_order)
+        if best is None or result[0] > best[0]:
+            best = result
+    return best
+
+
+def _init_worker(cipher, scores):
+    """Сохраняет шифртекст и таблицу биграмм в процессе-исполнителе"""
+    global _worker_cipher, _worker_scores
+    _worker_cipher = cipher
+    _worker_scores = scores
+
+
+def _search_task(task):
+    """Поиск для одного числа столбцов; task = (число столбцов, ширина луча)"""
+    num_cols, beam_width = task
+    return num_cols, search_width(_worker_cipher, num_cols, _worker_scores, beam_width)
+
+
+def recover_key(ciphertext, scores, widths=range(2, 21), beam_width=200, workers=1):
+    """
+    Восстанавливает число столбцов и их порядок по шифртексту
+
+    scores - таблица build_bigram_table
+    widths - проверяемые числа столбцов
+    workers - число процессов (None - число ядер, 1 - без пула)
+
+    Возвращает (порядок столбцов, открытый текст, оценка) лучшего
+    варианта; порядок - как у generate_key_order. Если ни одно число
+    столбцов не подошло - (None, None, None).
+    """
+    cipher = text_to_indices(ciphertext)
+    tasks = [(num_cols, beam_width) for num_cols in widths]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        results = [(num_cols, search_width(cipher, num_cols, scores, beam_width)) for num_cols, _ in tasks]
+    else:
+        with ProcessPoolExecutor(min(workers, len(tasks)), initializer=_init_worker,
+                                 initargs=(cipher, scores)) as executor:
+            results = list(executor.map(_search_task, tasks))
+
+    found = [result for _, result in results if result is not None]
+    if not found:
+        return None, None, None
+
+    score, key_order = max(found, key=lambda result: result[0])
+    return key_order, decrypt_with_order(clean_text(ciphertext), key_order), score
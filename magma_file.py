@@ -0,0 +1,142 @@
+"""
+Потоковое шифрование файлов алгоритмом МАГМА в режиме гаммирования (CTR)
+
+Примеры:
+    python -m magma_file encrypt -k <64 HEX> -i secret.txt -o secret.bin
+    python -m magma_file decrypt -k <64 HEX> -i secret.bin -o secret.txt
+    cat secret.txt | python -m magma_file encrypt -k <64 HEX> > secret.bin
+
+При шифровании в начало результата записывается синхропосылка (4 байта),
+при расшифровании она читается оттуда же. Файлы читаются через mmap,
+потоки - частями фиксированного размера в заранее выделенный буфер,
+поэтому расход памяти не зависит от размера данных.
+"""
+import argparse
+import mmap
+import os
+import sys
+
+from cryptography.magma import generate_round_keys, is_valid_hex
+from cryptography.magma_modes import BLOCK_SIZE, ctr_crypt
+
+IV_SIZE = BLOCK_SIZE // 2
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def read_full(stream, view):
+    """
+    Читает в view, пока буфер не заполнится или поток не закончится
+    (из канала за один вызов readinto может прийти меньше данных)
+    Возвращает число прочитанных байт.
+    """
+    total = 0
+    while total < len(view):
+        count = stream.readinto(view[total:])
+        if not count:
+            break
+        total += count
+    return total
+
+
+def iter_chunks(stream, chunk_size):
+    """
+    Выдаёт части входных данных размером chunk_size (последняя - короче)
+    Обычные файлы отображаются в память целиком через mmap,
+    остальные потоки читаются через readinto в один и тот же буфер.
+    """
+    try:
+        size = os.fstat(stream.fileno()).st_size
+        mappable = size > 0 and stream.seekable()
+    except (OSError, ValueError):
+        mappable = False
+
+    if mappable:
+        offset = stream.tell()
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                for start in range(offset, len(view), chunk_size):
+                    chunk = view[start:start + chunk_size]
+                    try:
+                        yield chunk
+                    finally:
+                        chunk.release()
+            finally:
+                view.release()
+        return
+
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    while True:
+        count = read_full(stream, view)
+        if count == 0:
+            return
+        yield view[:count]
+        if count < chunk_size:
+            return
+
+
+def crypt_stream(src, dst, round_keys, iv, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Шифрует (расшифровывает) поток src в dst, возвращает число байт"""
+    if chunk_size <= 0 or chunk_size % BLOCK_SIZE != 0:
+        raise ValueError(f"Размер части должен быть положительным и кратным {BLOCK_SIZE} байтам")
+
+    total = 0
+    for chunk in iter_chunks(src, chunk_size):
+        dst.write(ctr_crypt(chunk, round_keys, iv, total // BLOCK_SIZE))
+        total += len(chunk)
+    return total
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m magma_file",
+        description="Шифрование файлов алгоритмом МАГМА (ГОСТ Р 34.12-2015) в режиме CTR",
+    )
+    parser.add_argument("action", choices=["encrypt", "decrypt"], help="действие")
+    parser.add_argument("-k", "--key", required=True, help="ключ: 64 HEX символа (256 бит)")
+    parser.add_argument("-i", "--input", default="-", help="входной файл ('-' - stdin)")
+    parser.add_argument("-o", "--output", default="-", help="выходной файл ('-' - stdout)")
+    parser.add_argument("--iv", help="синхропосылка при шифровании: 8 HEX символов (по умолчанию случайная)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"размер части в байтах, кратный {BLOCK_SIZE} (по умолчанию {DEFAULT_CHUNK_SIZE})")
+    args = parser.parse_args(argv)
+
+    if not is_valid_hex(args.key, 64):
+        parser.error("ключ должен быть 64 HEX символа")
+    if args.iv is not None and not is_valid_hex(args.iv, 2 * IV_SIZE):
+        parser.error(f"синхропосылка должна быть {2 * IV_SIZE} HEX символов")
+    if args.iv is not None and args.action == "decrypt":
+        parser.error("при расшифровании синхропосылка читается из входных данных")
+    if args.chunk_size <= 0 or args.chunk_size % BLOCK_SIZE != 0:
+        parser.error(f"размер части должен быть положительным и кратным {BLOCK_SIZE}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    round_keys = generate_round_keys(args.key)
+
+    src = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    dst = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    try:
+        if args.action == "encrypt":
+            iv = bytes.fromhex(args.iv) if args.iv else os.urandom(IV_SIZE)
+            dst.write(iv)
+        else:
+            iv = src.read(IV_SIZE)
+            if len(iv) != IV_SIZE:
+                print("Ошибка: входные данные короче синхропосылки", file=sys.stderr)
+                return 1
+        crypt_stream(src, dst, round_keys, iv, args.chunk_size)
+        dst.flush()
+    finally:
+        if src is not sys.stdin.buffer:
+            src.close()
+        if dst is not sys.stdout.buffer:
+            dst.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())